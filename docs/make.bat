@@ -9,6 +9,9 @@ if "%SPHINXBUILD%" == "" (
 )
 set SOURCEDIR=source
 set BUILDDIR=build
+if "%SPHINXOPTS%" == "" (
+	set SPHINXOPTS=-j auto -q
+)
 
 %SPHINXBUILD% >NUL 2>NUL
 if errorlevel 9009 (
@@ -2,9 +2,20 @@
 #
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
+import gzip
+import hashlib
+import mmap
 import os
+import pickle
 import sys
-sys.path.insert(0, os.path.abspath("../.."))
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# ``DOCS_API=0`` gera apenas as páginas narrativas, sem importar o pacote.
+DOCS_API = os.environ.get("DOCS_API", "1") == "1"
+if DOCS_API:
+    sys.path.insert(0, str(ROOT))
 
 
 # -- Project information -----------------------------------------------------
@@ -24,11 +35,37 @@ release = '0.1.0'
 extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.napoleon',
-    'sphinx.ext.viewcode',
 ]
 
-templates_path = ['_templates']
-exclude_patterns: list[str] = []
+# ``viewcode`` realça todo o código-fonte a cada build; só é habilitado em
+# builds completos (publicação) via ``DOCS_FULL=1``.
+if os.environ.get('DOCS_FULL'):
+    extensions.append('sphinx.ext.viewcode')
+    viewcode_enable_epub = False
+    viewcode_follow_imported_members = False
+
+# ``_templates/`` não existe; evita a varredura extra por builder.
+templates_path: list[str] = []
+exclude_patterns: list[str] = [
+    '_build',
+    'Thumbs.db',
+    '.DS_Store',
+    '**/.ipynb_checkpoints',
+    '**/__pycache__',
+]
+if not DOCS_API:
+    exclude_patterns.append('api')
+
+# As docstrings do pacote seguem o estilo NumPy (``Parameters``/``Returns``);
+# o parser Google é desligado para não ser aplicado a cada docstring.
+napoleon_google_docstring = False
+napoleon_numpy_docstring = True
+napoleon_include_init_with_doc = False
+napoleon_use_ivar = True
+
+# Dependências pesadas/opcionais não precisam ser importadas para extrair
+# docstrings.
+autodoc_mock_imports = ['pyautogui', 'psutil', 'requests']
 
 
 
@@ -36,4 +73,133 @@ exclude_patterns: list[str] = []
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
 html_theme = 'alabaster'
-html_static_path = ['_static']
+# Sem ``html_static_path``: não há arquivos estáticos próprios.
+# Evita copiar os fontes ``.rst`` para ``_sources/`` e gerar o índice geral,
+# que não é referenciado pelo ``index.rst``.
+html_copy_source = False
+html_show_sourcelink = False
+html_use_index = False
+html_domain_indices = False
+
+
+# -- Extension setup ---------------------------------------------------------
+
+def _write_if_changed(path, data: bytes) -> bool:
+    """Grava ``data`` em ``path`` apenas se o conteúdo mudou.
+
+    Preserva o ``mtime`` de arquivos gerados idênticos, evitando que o Sphinx
+    os considere desatualizados. Retorna ``True`` se o arquivo foi escrito.
+    """
+    try:
+        with open(path, "rb") as fh:
+            old = fh.read()
+    except FileNotFoundError:
+        old = None
+    if old == data:
+        return False
+    with open(path, "wb") as fh:
+        fh.write(data)
+    return True
+
+
+# Cache de hashes das fontes. Em checkouts novos (CI) todos os arquivos têm
+# ``mtime`` recente e o Sphinx reprocessaria tudo, reimportando cada módulo
+# via autodoc. Para arquivos cujo conteúdo não mudou, o ``mtime`` gravado no
+# último build é restaurado e a página é reaproveitada das doctrees.
+# Como isso altera o ``mtime`` de arquivos versionados, só roda em CI (``CI``
+# definida, como no GitHub Actions) ou com ``DOCS_RESTORE_MTIMES=1``.
+DOCS_RESTORE_MTIMES = bool(
+    os.environ.get("CI") or os.environ.get("DOCS_RESTORE_MTIMES") == "1"
+)
+_HASH_CACHE = "source-hashes.pickle"
+_source_hashes: dict[str, tuple[str, int]] = {}
+
+
+def _tracked_sources(srcdir) -> list[Path]:
+    sources = sorted(Path(srcdir).rglob("*.rst"))
+    if DOCS_API:
+        sources += sorted((ROOT / "logger").rglob("*.py"))
+    return sources
+
+
+def _hash_file(path: Path) -> str:
+    """Calcula o blake2b de ``path`` lendo via ``mmap`` (sem cópia em buffer)."""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return hashlib.blake2b(digest_size=16).hexdigest()
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.blake2b(mm, digest_size=16).hexdigest()
+
+
+def _hash_tree(paths) -> tuple[str, dict[str, str]]:
+    """Hash combinado e hashes individuais de ``paths`` em uma única varredura."""
+    tree = hashlib.blake2b(digest_size=16)
+    digests: dict[str, str] = {}
+    for path in paths:
+        key = Path(path).relative_to(ROOT).as_posix()
+        digest = _hash_file(path)
+        digests[key] = digest
+        tree.update(f"{key}\0{digest}\n".encode())
+    return tree.hexdigest(), digests
+
+
+def _restore_unchanged_mtimes(app) -> None:
+    if os.environ.get("DOCS_AUTODOC_NOCACHE") or not DOCS_RESTORE_MTIMES:
+        return
+    try:
+        with open(Path(app.doctreedir) / _HASH_CACHE, "rb") as fh:
+            cached = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        cached = {}
+    _tree, digests = _hash_tree(_tracked_sources(app.srcdir))
+    for key, digest in digests.items():
+        path = ROOT / key
+        old = cached.get(key)
+        if old is not None and old[0] == digest:
+            os.utime(path, ns=(old[1], old[1]))
+        _source_hashes[key] = (digest, path.stat().st_mtime_ns)
+
+
+def _save_source_hashes(app, exception) -> None:
+    if exception is not None or not _source_hashes:
+        return
+    Path(app.doctreedir).mkdir(parents=True, exist_ok=True)
+    _write_if_changed(
+        Path(app.doctreedir) / _HASH_CACHE, pickle.dumps(_source_hashes)
+    )
+
+
+# ``DOCS_GZIP=1`` grava variantes ``.gz`` dos assets HTML para servidores que
+# entregam arquivos pré-comprimidos (ex.: ``gzip_static`` do nginx). O GitHub
+# Pages comprime por conta própria, por isso fica desligado por padrão.
+_GZIP_SUFFIXES = (".html", ".css", ".js")
+
+
+def _gzip_static(app, exception) -> None:
+    if exception is not None or not os.environ.get("DOCS_GZIP"):
+        return
+    if app.builder.format != "html":
+        return
+    for path in Path(app.outdir).rglob("*"):
+        if path.suffix in _GZIP_SUFFIXES:
+            data = gzip.compress(path.read_bytes(), compresslevel=9, mtime=0)
+            _write_if_changed(path.with_name(path.name + ".gz"), data)
+
+
+# Nenhuma diretiva/role customizada é registrada; autodoc e napoleon são
+# seguros para leitura e escrita paralelas (``-j auto``).
+
+def setup(app):
+    app.connect("builder-inited", _restore_unchanged_mtimes)
+    app.connect("build-finished", _save_source_hashes)
+    app.connect("build-finished", _gzip_static)
+    return {
+        "version": release,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
+
+
+if __name__ == "__main__":
+    # Chave de cache para o CI: ``python docs/source/conf.py``
+    print(_hash_tree(_tracked_sources(Path(__file__).parent))[0])
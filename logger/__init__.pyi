@@ -6,7 +6,7 @@ from .extras.progress import LoggerProgressBar
 from .extras.utils.timer import Timer
 
 class StructuredLogger(Logger):
-    def screen(self, msg: str, *args, webdriver=None, **kwargs) -> None:
+    def screen(self, msg: str, *args, webdriver=None, wait: bool = False, **kwargs) -> None:
         """Registra mensagem e captura de tela se possível."""
         ...
 
@@ -40,6 +40,10 @@ class StructuredLogger(Logger):
         """Retorna um ``Timer`` ligado ao logger."""
         ...
 
+    def log_lazy(self, level: int | str, template: str, *args: Any, **kwargs: Any) -> None:
+        """Registra a mensagem só se o nível estiver habilitado; argumentos chamáveis são avaliados tarde."""
+        ...
+
     def progress(
         self,
         iterable: Iterable[Any] | None = ...,
@@ -132,6 +136,7 @@ class StructuredLogger(Logger):
     _monitor: Any
     _dep_manager: Any
     _net_monitor: Any
+    _queue_listener: Any
 
 
 def start_logger(
@@ -143,6 +148,8 @@ def start_logger(
     verbose: int = 0,
     *,
     show_profiling: bool = False,
+    profile_sampling: bool = False,
+    file_buffer_size: int = 65536,
     show_all_leaks: bool = False,
     watch_objects: Iterable[str] | None = None,
 ) -> StructuredLogger:
@@ -5,164 +5,424 @@ Uso:
     from logger.core.context import ContextManager, Profiler, logger_context
 """
 
-from contextlib import contextmanager
-from contextvars import ContextVar
+from collections import Counter
+from contextlib import ContextDecorator, contextmanager
+from contextvars import ContextVar, Token
 from logging import Logger
 from typing import Callable, Any, Optional, ContextManager as TypingContextManager, Iterator
-import inspect
-from pathlib import Path
+import os
+import sys
 import cProfile
 import functools
+import heapq
 import io
 import pstats
+import re
+import threading
+import time
+from types import CodeType, MethodType
 from logger.extras.progress import format_block
+from logger.extras.helpers import _log_method
+from logger.formatters.custom import AutomaticTracebackLogger
 
 # Funcoes internas ignoradas na cadeia de profiling
-_INTERNAL_FUNCS = {
+_INTERNAL_FUNCS = frozenset({
     'format', '_extract_call_chain', '_init_colorama',
     '_define_custom_levels', '_setup_directories', '_get_log_filename',
     '_attach_screenshot', 'screen', 'logger_progress', '__call__',
     '_log_progress', 'log_with_context', '_log_start', '_log_end',
     'emit', 'logger_profile', 'logger_profile_cm', 'logger_profile_report',
     'logger_log_start', 'logger_log_end'
-}
+})
+# Linha do relatorio de profiling
+_REPORT_LINE_FMT = "%s | chamadas: %d | acumulado: %.3fs | próprio: %.3fs"
+# Caminhos de modulos internos ignorados na cadeia de profiling
+_INTERNAL_PATH_RE = re.compile(r"logging|inspect|colorama|threading|logger/")
 
-# Armazena o método original de logging antes de qualquer monkey patch
+# Metodo original de logging, chamado pelo wrapper de contexto
 _original_log_method = Logger._log
 
-# Variavel de contexto global para rastreamento da pilha de contextos
-_log_context: ContextVar[list[str]] = ContextVar('log_context', default=[])
+_CONTEXT_SEPARATOR = ' → '
+
+# Variavel de contexto global para rastreamento da pilha de contextos.
+# Cada no e imutavel: (pai, nome, profundidade, string ja unida). O push apenas
+# cria um novo no apontando para o anterior, sem copiar a pilha.
+_ContextNode = tuple[Optional['_ContextNode'], str, int, str]
+_log_context: ContextVar[Optional[_ContextNode]] = ContextVar(
+    'log_context', default=None
+)
+_ctx_get = _log_context.get
+_ctx_set = _log_context.set
+_ctx_reset = _log_context.reset
+
+
+# Modulos cujos frames nunca identificam o arquivo chamador
+_SKIPPED_MODULES = ("logging", "inspect", "colorama", "threading")
+
+# Decisao (ignorar frame?, nome exibido) memorizada por objeto de codigo.
+# A chave e ``id(code)``: objetos de codigo iguais em arquivos distintos sao
+# ``==``. O proprio codigo fica no valor, mantendo o id valido e conferivel.
+# Limitado a ``_FILE_CONTEXTS_MAX`` entradas para nao reter codigo de
+# ``exec``/modulos recarregados indefinidamente.
+_FILE_CONTEXTS: dict[int, tuple[CodeType, bool, str | None]] = {}
+_FILE_CONTEXTS_MAX = 2048
 
 
 def _get_file_context() -> str | None:
     """Retorna o nome do arquivo chamador caso nao seja parte do pacote."""
-    for frame_info in inspect.stack():
-        module = frame_info.frame.f_globals.get("__name__", "")
-        if module.startswith(("logging", "inspect", "colorama", "threading")):
-            continue
-        path = frame_info.filename.replace("\\", "/")
-        if "/logger/" in path:
-            continue
-        name = Path(path).name
-        if name == "main.py":
-            return None
-        return Path(path).stem
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        entry = _FILE_CONTEXTS.get(id(code))
+        if entry is None or entry[0] is not code:
+            if frame.f_globals.get("__name__", "").startswith(_SKIPPED_MODULES):
+                entry = (code, True, None)
+            else:
+                entry = (code, *_file_stem(code.co_filename))
+            if len(_FILE_CONTEXTS) >= _FILE_CONTEXTS_MAX:
+                _FILE_CONTEXTS.clear()
+            _FILE_CONTEXTS[id(code)] = entry
+        if not entry[1]:
+            return entry[2]
+        frame = frame.f_back
     return None
 
+
+@functools.lru_cache(maxsize=512)
+def _file_stem(filename: str) -> tuple[bool, str | None]:
+    """Indica se ``filename`` e do pacote e devolve o nome exibido no contexto.
+
+    ``main.py`` nao gera contexto (``None``).
+    """
+    path = filename.replace("\\", "/")
+    if "/logger/" in path:
+        return True, None
+    name = os.path.basename(path)
+    if name == "main.py":
+        return False, None
+    return False, os.path.splitext(name)[0]
+
+class _ContextScope(ContextDecorator):
+    """Escopo de um contexto: empilha ``name`` na entrada e restaura na saida.
+
+    Tambem pode decorar funcoes; cada chamada usa um escopo novo.
+    """
+    __slots__ = ('_name', '_separator', '_token')
+
+    def __init__(self, name: str, separator: str = _CONTEXT_SEPARATOR) -> None:
+        self._name: str = name
+        self._separator: str = separator
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> None:
+        parent = _ctx_get()
+        name = self._name
+        if parent is None:
+            node = (None, name, 1, name)
+        else:
+            node = (parent, name, parent[2] + 1, f"{parent[3]}{self._separator}{name}")
+        self._token = _ctx_set(node)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _ctx_reset(self._token)  # type: ignore[arg-type]
+
+    def _recreate_cm(self) -> "_ContextScope":
+        return _ContextScope(self._name, self._separator)
+
 class ContextManager:
     """Gerencia contextos hierarquicos para o logger."""
-    def __init__(self):
-        self._context_separator = ' → '
+    def __init__(self) -> None:
+        self._context_separator: str = _CONTEXT_SEPARATOR
 
     def get_current_context(self) -> str:
-        contexts = _log_context.get()
-        return self._context_separator.join(contexts) if contexts else ''
+        node = _ctx_get()
+        return node[3] if node is not None else ''
+
+    def get_context_names(self) -> list[str]:
+        """Nomes dos contextos ativos, do mais externo ao mais interno."""
+        node = _ctx_get()
+        if node is None:
+            return []
+        names = [''] * node[2]
+        while node is not None:
+            names[node[2] - 1] = node[1]
+            node = node[0]
+        return names
 
-    @contextmanager
-    def context(self, name: str):
-        token = _log_context.set(_log_context.get() + [name])
-        try:
-            yield
-        finally:
-            _log_context.reset(token)
+    def context(self, name: str) -> _ContextScope:
+        return _ContextScope(name, self._context_separator)
 
 # --- Funcoes utilitarias ligadas ao logger ---
 
 def logger_context(self: Logger, name: str) -> TypingContextManager[None]:
     """Adiciona contexto temporario aos logs."""
-    @contextmanager
-    def context_wrapper():
-        with self._context_manager.context(name):
-            yield
-    return context_wrapper()
+    return self._context_manager.context(name)  # type: ignore[attr-defined]
 
-def log_with_context(self: Logger, level, msg, args, **kwargs):
+def log_with_context(
+    self: Logger,
+    level: int,
+    msg: object,
+    args: Any,
+    *,
+    _original_log: Callable[..., None] = _original_log_method,
+    _ctx_get: Callable[[], Optional[_ContextNode]] = _ctx_get,
+    **kwargs: Any,
+) -> None:
     """Inclui o contexto atual nas mensagens de log se disponivel."""
-    context_manager = getattr(self, "_context_manager", None)
-    contexts: list[str] = []
-    if context_manager:
-        ctx = context_manager.get_current_context()
-        if ctx:
-            contexts.append(ctx)
+    # chamadas diretas a ``_log`` nao passam pelo filtro de nivel de ``info`` & cia
+    if not self.isEnabledFor(level):
+        return
+    # ``ContextLogger._context_manager`` tem padrao ``None`` na classe
+    node = _ctx_get() if self._context_manager is not None else None  # type: ignore[attr-defined]
     file_ctx = _get_file_context()
-    if file_ctx:
-        contexts.append(file_ctx)
-    context_str = " → ".join(contexts) if contexts else ""
-    extra = kwargs.pop("extra", {}) or {}
-    if context_str:
-        extra = {**extra, "context": context_str}
-    original = getattr(self, "_original_log", _original_log_method)
-    original(self, level, msg, args, extra=extra, **kwargs)
+    if node is None and not file_ctx:
+        # caminho rapido: nada a acrescentar ao registro
+        return _original_log(self, level, msg, args, **kwargs)
+    context_str: str
+    if node is None:
+        context_str = file_ctx  # type: ignore[assignment]
+    elif file_ctx:
+        context_str = node[3] + _CONTEXT_SEPARATOR + file_ctx
+    else:
+        context_str = node[3]
+    extra = kwargs.pop("extra", None)
+    extra = {**extra, "context": context_str} if extra else {"context": context_str}
+    _original_log(self, level, msg, args, extra=extra, **kwargs)
+
+class ContextLogger(AutomaticTracebackLogger):
+    """Logger cujo ``_log`` acrescenta o contexto atual aos registros.
+
+    Apenas loggers desta classe pagam o custo do contexto; os demais loggers
+    do processo (bibliotecas, stdlib) mantem o ``Logger._log`` original.
+    """
+    _context_manager: Optional[ContextManager] = None
+    _log = log_with_context  # type: ignore[assignment]
+
+@functools.lru_cache(maxsize=4096)
+def _is_internal_func(filename: str, name: str) -> bool:
+    """Indica se a funcao ``name`` de ``filename`` deve sair da cadeia de profiling."""
+    if name in _INTERNAL_FUNCS:
+        return True
+    path = filename.replace("\\", "/")
+    return not path.endswith(".py") or _INTERNAL_PATH_RE.search(path) is not None
+
+class _SamplingProfiler:
+    """Amostra periodicamente a pilha de uma thread em segundo plano.
+
+    Ao contrario do cProfile, nao instrumenta cada chamada: o custo depende
+    apenas de ``interval``. ``stats`` devolve os dados no formato do
+    ``pstats`` (contagens sao amostras, tempos sao estimados).
+    """
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._own: Counter = Counter()
+        self._total: Counter = Counter()
+        self._edges: Counter = Counter()
+        self._samples = 0
+        self._elapsed = 0.0
+        # protege os contadores, alterados pela thread de amostragem
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, ident: int) -> None:
+        """Inicia (ou retoma, acumulando) a amostragem da thread ``ident``."""
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, args=(ident, self._stop_event),
+            name="logger-profiler", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._elapsed += time.monotonic() - self._started
+
+    def _run(self, ident: int, stop_event: threading.Event) -> None:
+        current_frames = sys._current_frames
+        while not stop_event.wait(self.interval):
+            frame = current_frames().get(ident)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        with self._lock:
+            self._samples += 1
+            self._own[stack[0]] += 1
+            self._total.update(set(stack))
+            self._edges.update(zip(stack[1:], stack))  # (chamador, chamado)
+
+    def elapsed(self) -> float:
+        """Tempo amostrado, incluindo a sessao em andamento."""
+        if self._thread is not None:
+            return self._elapsed + time.monotonic() - self._started
+        return self._elapsed
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = self._samples
+            own = self._own.copy()
+            total = self._total.copy()
+            edges = self._edges.copy()
+        per_sample = self.elapsed() / samples if samples else self.interval
+        stats = {
+            func: (n, n, own[func] * per_sample, n * per_sample, {})
+            for func, n in total.items()
+        }
+        for (caller, callee), n in edges.items():
+            stats[callee][4][caller] = (n, n, 0.0, n * per_sample)
+        return stats
 
 class Profiler:
-    """Gerenciador simples para profiling utilizando cProfile."""
-    def __init__(self):
+    """Gerenciador simples para profiling utilizando cProfile.
+
+    Com ``sampling=True`` usa amostragem de pilha a cada ``interval``
+    segundos, com overhead bem menor em lacos quentes.
+    """
+    def __init__(self, sampling: bool = False, interval: float = 0.005):
         self.profiler = None
+        self.sampling = sampling
+        self.interval = interval
         self._active = False
+        self._ident: int | None = None
+        self._last_report: str | None = None
 
-    def start(self) -> None:
+    def start(self, reset: bool = True) -> None:
+        """Inicia o profiling; com ``reset=False`` acumula sobre a sessao anterior."""
         if not self._active:
-            self.profiler = cProfile.Profile()
-            self.profiler.enable()
+            self._last_report = None
+            if self.sampling:
+                if self.profiler is None or reset:
+                    self.profiler = _SamplingProfiler(self.interval)
+                self._ident = threading.get_ident()
+                self.profiler.start(self._ident)
+            else:
+                # a mesma instancia do cProfile e reaproveitada entre sessoes
+                if self.profiler is None:
+                    self.profiler = cProfile.Profile()
+                elif reset:
+                    self.profiler.clear()
+                self.profiler.enable()
             self._active = True
 
+    def reset(self) -> None:
+        """Descarta as estatisticas coletadas ate agora.
+
+        Com o profiling ativo a coleta continua a partir de zero.
+        """
+        self._last_report = None
+        if self.sampling:
+            if self.profiler is not None:
+                # a thread de amostragem e encerrada antes de ser descartada
+                self.profiler.stop()
+                self.profiler = None
+                if self._active:
+                    self.profiler = _SamplingProfiler(self.interval)
+                    self.profiler.start(self._ident)
+        elif self.profiler is not None:
+            self.profiler.clear()
+
     def stop(self) -> str:
+        """Encerra o profiling e devolve o relatorio (``format_top``)."""
         if not self._active:
             return "Profiler não está ativo"
-        self.profiler.disable()
+        self._halt()
+        return self.format_top()
+
+    def _halt(self) -> None:
+        """Encerra a coleta sem montar relatorio."""
+        if not self._active:
+            return
         self._active = False
-        s = io.StringIO()
-        ps = pstats.Stats(self.profiler, stream=s).sort_stats('cumulative')
-        ps.print_stats(20)
-        return s.getvalue()
+        if self.sampling:
+            self.profiler.stop()
+        else:
+            self.profiler.disable()
+
+    def format_top(self, limit: int = 20) -> str:
+        """Relatorio das ``limit`` funcoes mais custosas (reaproveitado ate o proximo ``start``)."""
+        if not self.profiler:
+            return "Profiler não está ativo"
+        if self._last_report is None:
+            if self.sampling:
+                self._last_report = "\n".join(self.get_report_lines(limit))
+            else:
+                s = io.StringIO()
+                ps = pstats.Stats(self.profiler, stream=s).strip_dirs().sort_stats('cumulative')
+                ps.print_stats(limit)
+                self._last_report = s.getvalue()
+        return self._last_report
 
     def _build_chain(
         self,
         func: tuple[str, int, str],
         stats: dict,
         depth: int = 3,
+        best_callers: dict | None = None,
     ) -> list[tuple[str, int, str]]:
-        if depth <= 0:
-            return [func]
-        callers = stats.get(func, (0, 0, 0.0, 0.0, {}))[4]
-        if not callers:
-            return [func]
-        best = max(callers.items(), key=lambda kv: kv[1][3])[0]
-        return self._build_chain(best, stats, depth - 1) + [func]
+        """Sobe ate ``depth`` niveis pelo chamador de maior tempo acumulado.
+
+        ``best_callers`` memoriza o chamador escolhido para cada funcao e pode
+        ser compartilhado entre chamadas sobre o mesmo ``stats``.
+        """
+        if best_callers is None:
+            best_callers = {}
+        chain = [func]
+        current = func
+        for _ in range(depth):
+            if current in best_callers:
+                best = best_callers[current]
+            else:
+                callers = stats.get(current, (0, 0, 0.0, 0.0, {}))[4]
+                best = max(callers.items(), key=lambda kv: kv[1][3])[0] if callers else None
+                best_callers[current] = best
+            if best is None:
+                break
+            chain.append(best)
+            current = best
+        chain.reverse()
+        return chain
 
     def _is_internal(self, func: tuple[str, int, str]) -> bool:
-        filename, _lineno, name = func
-        path = filename.replace("\\", "/")
-        if name in _INTERNAL_FUNCS:
-            return True
-        if any(part in path for part in ("logging", "inspect", "colorama", "threading")):
-            return True
-        if "logger/" in path:
-            return True
-        if not path.endswith(".py"):
-            return True
-        return False
+        return _is_internal_func(func[0], func[2])
 
     def get_report_lines(self, limit: int = 10) -> list[str]:
         """Linhas de profiling ordenadas por tempo acumulado em português."""
         if not self.profiler:
             return []
-        ps = pstats.Stats(self.profiler)
-        ps.calc_callees()
-        stats_dict: dict = getattr(ps, "stats", {})  # type: ignore[attr-defined]
-        items = []
-        for func, (cc, nc, tt, ct, callers) in stats_dict.items():
-            items.append((ct, tt, nc, func))
-        items.sort(reverse=True)
-        lines = []
-        for ct, tt, nc, func in items[:limit]:
-            chain = [f for f in self._build_chain(func, stats_dict) if not self._is_internal(f)]
-            if not chain:
-                chain = [func]
+        if self.sampling:
+            stats_dict = self.profiler.stats()
+        else:
+            ps = pstats.Stats(self.profiler)
+            ps.calc_callees()
+            stats_dict = getattr(ps, "stats", {})  # type: ignore[attr-defined]
+        # filtra antes de ordenar: so os ``limit`` maiores sao necessarios
+        top = heapq.nlargest(limit, (
+            (ct, tt, nc, func)
+            for func, (cc, nc, tt, ct, callers) in stats_dict.items()
+            if not self._is_internal(func)
+        ))
+        lines: list[str] = [""] * len(top)
+        best_callers: dict = {}
+        for i, (ct, tt, nc, func) in enumerate(top):
+            chain = [
+                f for f in self._build_chain(func, stats_dict, best_callers=best_callers)
+                if not self._is_internal(f)
+            ]
             names = " → ".join(f[2] for f in chain)
-            lines.append(
-                f"{names} | chamadas: {nc} | acumulado: {ct:.3f}s | próprio: {tt:.3f}s"
-            )
+            lines[i] = _REPORT_LINE_FMT % (names, nc, ct, tt)
         return lines
 
 # --- Wrappers de profiling ---
@@ -170,13 +430,13 @@ class Profiler:
 @contextmanager
 def logger_profile_cm(self: Logger, name: str | None = None) -> Iterator[None]:
     section_name = name or 'Seção'
-    self.info(f"🔍 Iniciando profiling: {section_name}")
+    self.info("🔍 Iniciando profiling: %s", section_name)
     self._profiler.start()  # type: ignore[attr-defined]
     try:
         yield
     finally:
         report = self._profiler.stop()  # type: ignore[attr-defined]
-        self.info(f"📊 Resultado do profiling ({section_name}):\n{report}")
+        self.info("📊 Resultado do profiling (%s):\n%s", section_name, report)
 
 def logger_profile(
     self: Logger,
@@ -202,7 +462,7 @@ def logger_profile_report(
 ) -> str | None:
     """Gera um resumo do profiling executado."""
     
-    self._profiler.stop()  # type: ignore[attr-defined]
+    self._profiler._halt()  # type: ignore[attr-defined]
     lines = self._profiler.get_report_lines(limit)  # type: ignore[attr-defined]
     if not lines:
         return None
@@ -210,25 +470,26 @@ def logger_profile_report(
     if return_block:
         return block
       
-    getattr(self, level.lower())(f"\n{block}", extra={"plain": True, "file_only": True})
+    _log_method(self, level)(f"\n{block}", extra={"plain": True, "file_only": True})
     return None
 
-def _setup_context_and_profiling(logger: Logger) -> None:
+def _setup_context_and_profiling(logger: Logger, profile_sampling: bool = False) -> None:
     """Configura suporte a contexto e profiling na instancia do logger."""
     context_manager: ContextManager = ContextManager()
-    profiler = Profiler()
+    profiler = Profiler(sampling=profile_sampling)
 
     # guarda instancias no logger
     setattr(logger, '_context_manager', context_manager)
     setattr(logger, '_profiler', profiler)
 
-    # Salva o metodo original apenas na primeira execucao
-    if not hasattr(logger, '_original_log'):
-        setattr(logger, '_original_log', _original_log_method)
+    # loggers de outras classes (ex.: root) recebem o wrapper apenas na
+    # propria instancia
+    if not isinstance(logger, ContextLogger):
+        setattr(logger, '_log', MethodType(log_with_context, logger))
+
 
-    # Aplica wrappers na classe para permitir uso pelos loggers criados
-    Logger._log = log_with_context  # type: ignore[assignment]
-    setattr(Logger, 'context', logger_context)
-    setattr(Logger, 'profile', logger_profile)
-    setattr(Logger, 'profile_cm', logger_profile_cm)
-    setattr(Logger, 'profile_report', logger_profile_report)
+# Metodos de contexto/profiling acoplados a classe ``Logger`` na importacao
+setattr(Logger, 'context', logger_context)
+setattr(Logger, 'profile', logger_profile)
+setattr(Logger, 'profile_cm', logger_profile_cm)
+setattr(Logger, 'profile_report', logger_profile_report)
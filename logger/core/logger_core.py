@@ -6,24 +6,33 @@ funcionalidades específicas para módulos em ``logger.extras``.
 
 from __future__ import annotations
 
+import functools
 import logging
-from logging import Logger, FileHandler
+from logging import Logger
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 from logger.formatters.custom import (
     CustomFormatter,
-    AutomaticTracebackLogger,
     _define_custom_levels,
 )
-from logger.handlers import ProgressStreamHandler, FileOnlyFilter
-from logger.core.context import _setup_context_and_profiling
+from logger.handlers import (
+    BufferedFileHandler,
+    ProgressStreamHandler,
+    FileOnlyFilter,
+    DedupFilter,
+    _setup_async_handlers,
+    _stop_listener,
+)
+from logger.handlers.file_handler import _BUFFER_SIZE
+from logger.core.context import ContextLogger, _setup_context_and_profiling
 from logger.extras import (
     _init_colorama,
     _setup_directories,
     _get_log_filename,
     logger_sleep,
     logger_timer,
+    logger_log_lazy,
     logger_progress,
     logger_capture_prints,
     _setup_metrics,
@@ -42,6 +51,75 @@ from logger.extras import (
 # Logger configuration
 # ---------------------------------------------------------------------------
 
+def _level_value(name: str) -> int:
+    """Converte ``console_level``/``file_level`` no valor numérico.
+
+    Usa o registro do ``logging``: aceita aliases (``WARN``, ``FATAL``) e os
+    níveis customizados (``SUCCESS``, ``SCREEN``).
+    """
+    value = logging._nameToLevel.get(name.upper())
+    if value is None:
+        names = sorted(logging._nameToLevel, key=logging._nameToLevel.__getitem__)
+        raise ValueError(
+            f"Nível de log inválido: {name!r} (válidos: {', '.join(names)})"
+        )
+    return value
+
+# Preparação por instância executada em sequência por ``start_logger``
+_INSTANCE_SETUPS = (
+    _setup_metrics,
+    _setup_monitoring,
+    _setup_dependencies_and_network,
+    _setup_lifecycle,
+)
+
+_DATEFMT = "%Y-%m-%d %H:%M:%S"
+_CONSOLE_FMT = (
+    "{asctime} {emoji} {levelname_color}{levelpad}- {message} {thread_disp}"
+)
+
+
+def _select_file_fmt(level: int) -> str:
+    """Devolve o formato dos arquivos conforme ``verbose``."""
+    base_fmt   = "{asctime} {emoji} {levelname}{levelpad}- {message}"
+    chain      = " [Cadeia de Funcoes: {call_chain}📍]"
+    path_line  = " [{pathname}:{lineno}] -"
+    thread     = " {thread_disp}"
+    if level <= 0:
+        return base_fmt
+    elif level == 1:
+        return f"{base_fmt} <>{chain}"
+    elif level == 2:
+        return f"{base_fmt} <>{path_line}{chain}"
+    else:  # 3 ou mais
+        return f"{base_fmt} <>{path_line}{chain}{thread}"
+
+
+# Formatos pré-calculados para verbose 0..3
+_FILE_FMTS = tuple(_select_file_fmt(i) for i in range(4))
+
+
+# Versões pré-compiladas dos formatos mais usados (console e verbose 0),
+# equivalentes a ``fmt.format(**record.__dict__)`` sem interpretar o formato
+_COMPILED_FMTS: dict[str, Callable[[logging.LogRecord], str]] = {
+    _CONSOLE_FMT: lambda r: (
+        f"{r.asctime} {r.emoji} {r.levelname_color}{r.levelpad}- {r.message} {r.thread_disp}"
+    ),
+    _FILE_FMTS[0]: lambda r: f"{r.asctime} {r.emoji} {r.levelname}{r.levelpad}- {r.message}",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_formatter(fmt: str, use_color: bool) -> CustomFormatter:
+    """Devolve um ``CustomFormatter`` compartilhado por formato e cor."""
+    return CustomFormatter(
+        fmt=fmt,
+        datefmt=_DATEFMT,
+        style="{",
+        use_color=use_color,
+        render=_COMPILED_FMTS.get(fmt),
+    )
+
 # ----- Função principal -----------------------------------------------------
 def start_logger(
     name: str | None = None,
@@ -52,6 +130,8 @@ def start_logger(
     verbose: int = 0,
     *,
     show_profiling: bool = False,
+    profile_sampling: bool = False,
+    file_buffer_size: int = _BUFFER_SIZE,
     show_all_leaks: bool = False,
     watch_objects: Iterable[str] | None = None,
 ) -> Logger:
@@ -75,15 +155,36 @@ def start_logger(
 
     show_profiling:
         Define se o resumo de profiling será exibido ao final da execução.
+
+    profile_sampling:
+        Usa profiling por amostragem de pilha em vez do ``cProfile``, com
+        overhead bem menor em laços intensos (tempos passam a ser estimados).
+
+    file_buffer_size:
+        Tamanho em bytes do buffer dos arquivos de log. Registros abaixo de
+        WARNING acumulam no buffer até a fila esvaziar; ``1`` grava linha a
+        linha. Valores menores que ``1`` geram ``ValueError``.
+
+    Se ``name`` já tiver um logger ativo (sem ``end``) criado com os mesmos
+    argumentos, ele é devolvido sem reconfiguração; com argumentos
+    diferentes o logger é reconfigurado.
     """
+    if file_buffer_size < 1:
+        raise ValueError(f"file_buffer_size deve ser >= 1, recebido {file_buffer_size}")
+    setup_args = (
+        str(Path(log_dir)), console_level, file_level, capture_prints, verbose,
+        show_profiling, profile_sampling, file_buffer_size, show_all_leaks,
+        frozenset(watch_objects or ()),
+    )
+    existing = _active_logger(name, setup_args)
+    if existing is not None:
+        return existing
     logger = _configure_base_logger(
-        name, log_dir, console_level, file_level, verbose
+        name, log_dir, console_level, file_level, verbose, file_buffer_size
     )
-    _setup_metrics(logger)
-    _setup_monitoring(logger)
-    _setup_context_and_profiling(logger)
-    _setup_dependencies_and_network(logger)
-    _setup_lifecycle(logger)
+    for setup in _INSTANCE_SETUPS:
+        setup(logger)
+    _setup_context_and_profiling(logger, profile_sampling)
     setattr(logger, "_show_profiling", show_profiling)
     setattr(logger, "_leak_show_all", show_all_leaks)
     setattr(logger, "_leak_watch", set(watch_objects or []))
@@ -92,9 +193,20 @@ def start_logger(
         logger.capture_prints(True)  # type: ignore[attr-defined]
     logger.memory_snapshot()  # type: ignore[attr-defined]
     logger.start(show_profiling=show_profiling)  # type: ignore[attr-defined]
+    setattr(logger, "_setup_args", setup_args)
     return logger
 
 
+def _active_logger(name: str | None, setup_args: tuple) -> Logger | None:
+    """Devolve o logger ``name`` se ativo e configurado com ``setup_args``."""
+    existing = logging.Logger.manager.loggerDict.get(name) if name else logging.root
+    if not isinstance(existing, Logger) or getattr(existing, "_end_called", True):
+        return None
+    if getattr(existing, "_setup_args", None) != setup_args:
+        return None
+    return existing
+
+
 # ----------------------- _configure_base_logger -----------------------------
 def _configure_base_logger(
     name: str | None,
@@ -102,6 +214,7 @@ def _configure_base_logger(
     console_level: str = "INFO",
     file_level: str = "DEBUG",
     verbose: int = 0,
+    file_buffer_size: int = _BUFFER_SIZE,
 ) -> Logger:
     """
     Monta toda a estrutura de logging (cores, arquivos, níveis).
@@ -109,90 +222,81 @@ def _configure_base_logger(
     Retorna:
         Logger já configurado com handlers de console e arquivo.
     """
-    # 🎨 Cores & níveis customizados
-    _init_colorama()
-    _define_custom_levels()
-
-    console_level_value = getattr(logging, console_level)
-    file_level_value    = getattr(logging, file_level)
+    console_level_value = _level_value(console_level)
+    file_level_value    = _level_value(file_level)
 
     # 📂 Diretórios
     base = Path(log_dir)
     screen_dir, debug_dir = _setup_directories(base)
 
     filename = _get_log_filename(name)
+    info_path  = base / filename
+    debug_file = debug_dir / filename
 
-    # 🪄 Subclasse que adiciona traceback automático
-    logging.setLoggerClass(AutomaticTracebackLogger)
+    # 🪄 Subclasse que adiciona traceback automático e contexto, aplicada só
+    # a esta instância para não afetar os ``getLogger`` de outras bibliotecas
     logger = logging.getLogger(name)
+    if type(logger) is Logger:
+        logger.__class__ = ContextLogger
     logger.setLevel(min(console_level_value, file_level_value))
+    previous_listener = getattr(logger, "_queue_listener", None)
+    if previous_listener is not None:
+        _stop_listener(previous_listener)
     logger.handlers.clear()
 
     # --------------------- FORMATAÇÃO ---------------------------------------
-    datefmt = "%Y-%m-%d %H:%M:%S"
-    console_fmt = (
-        "{asctime} {emoji} {levelname_color}{levelpad}- {message} {thread_disp}"
-    )
-
-    # Função helper que devolve o formato conforme verbose
-    def _select_file_fmt(level: int) -> str:
-        base_fmt   = "{asctime} {emoji} {levelname}{levelpad}- {message}"
-        chain      = " [Cadeia de Funcoes: {call_chain}📍]"
-        path_line  = " [{pathname}:{lineno}] -"
-        thread     = " {thread_disp}"
-        if level <= 0:
-            return base_fmt
-        elif level == 1:
-            return f"{base_fmt} <>{chain}"
-        elif level == 2:
-            return f"{base_fmt} <>{path_line}{chain}"
-        else:  # 3 ou mais
-            return f"{base_fmt} <>{path_line}{chain}{thread}"
-
-    file_fmt_info  = _select_file_fmt(verbose)   # ← para handler INFO
-    file_fmt_debug = _select_file_fmt(3)         # ← verbosidade máxima
+    file_fmt_info  = _FILE_FMTS[max(0, min(verbose, 3))]   # ← para handler INFO
+    file_fmt_debug = _FILE_FMTS[3]                         # ← verbosidade máxima
 
     # --------------------- HANDLERS -----------------------------------------
     # Console
     ch = ProgressStreamHandler()
     ch.setLevel(console_level_value)
-    ch.setFormatter(CustomFormatter(fmt=console_fmt, datefmt=datefmt, style="{"))
+    ch.setFormatter(_get_formatter(_CONSOLE_FMT, True))
     ch.addFilter(FileOnlyFilter())
+    ch.addFilter(DedupFilter())
     logger.addHandler(ch)
 
     # Arquivo DEBUG – sempre no formato máximo
-    formatter_dbg = CustomFormatter(
-        fmt=file_fmt_debug, datefmt=datefmt, style="{", use_color=False
+    formatter_dbg = _get_formatter(file_fmt_debug, False)
+    fh_dbg = BufferedFileHandler(
+        debug_file, encoding="utf-8", buffer_size=file_buffer_size
     )
-    fh_dbg = FileHandler(debug_dir / filename, encoding="utf-8")
     fh_dbg.setLevel(logging.DEBUG)
     fh_dbg.setFormatter(formatter_dbg)
-    logger.addHandler(fh_dbg)
 
-    # Arquivo INFO – formato depende de verbose
-    formatter_info = CustomFormatter(
-        fmt=file_fmt_info, datefmt=datefmt, style="{", use_color=False
+    # Arquivo INFO – formato depende de verbose (mesmo objeto se igual ao DEBUG)
+    formatter_info = _get_formatter(file_fmt_info, False)
+    fh_info = BufferedFileHandler(
+        info_path, encoding="utf-8", buffer_size=file_buffer_size
     )
-    fh_info = FileHandler(base / filename, encoding="utf-8")
     fh_info.setLevel(logging.INFO)
     fh_info.setFormatter(formatter_info)
-    logger.addHandler(fh_info)
+
+    # Arquivos gravados em segundo plano; o logger recebe só a fila
+    _setup_async_handlers(logger, [fh_dbg, fh_info])
 
     # --------------------- METADADOS & AZÚCAR -------------------------------
     setattr(logger, "_screen_dir", screen_dir)
     setattr(logger, "_screen_name", name or "log")
-    setattr(logger, "log_path",   str(base / filename))
-    setattr(logger, "debug_log_path", str(debug_dir / filename))
-
-    # Métodos utilitários
-    setattr(Logger, "screen",          screen)
-    setattr(Logger, "cleanup",         cleanup)
-    setattr(Logger, "path",            path)
-    setattr(Logger, "debug_path",      debug_path)
-    setattr(Logger, "pause",           pause)
-    setattr(Logger, "sleep",           logger_sleep)
-    setattr(Logger, "timer",           logger_timer)
-    setattr(Logger, "progress",        logger_progress)
-    setattr(Logger, "capture_prints",  logger_capture_prints)
+    setattr(logger, "log_path",   str(info_path))
+    setattr(logger, "debug_log_path", str(debug_file))
 
     return logger
+
+
+# Métodos utilitários acoplados à classe ``Logger`` na importação
+setattr(Logger, "screen",          screen)
+setattr(Logger, "cleanup",         cleanup)
+setattr(Logger, "path",            path)
+setattr(Logger, "debug_path",      debug_path)
+setattr(Logger, "pause",           pause)
+setattr(Logger, "sleep",           logger_sleep)
+setattr(Logger, "timer",           logger_timer)
+setattr(Logger, "log_lazy",        logger_log_lazy)
+setattr(Logger, "progress",        logger_progress)
+setattr(Logger, "capture_prints",  logger_capture_prints)
+
+# 🎨 Cores & níveis customizados, preparados uma única vez na importação
+_init_colorama()
+_define_custom_levels()
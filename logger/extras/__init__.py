@@ -41,6 +41,7 @@ from .monitoring import (
 )
 from .utils.sleep import logger_sleep as logger_sleep
 from .utils.timer import Timer as Timer, logger_timer as logger_timer
+from .utils.lazy import logger_log_lazy as logger_log_lazy
 from .logger_lifecycle import (
     logger_log_start as logger_log_start,
     logger_log_end as logger_log_end,
@@ -77,6 +78,7 @@ __all__ = [
     "logger_sleep",
     "Timer",
     "logger_timer",
+    "logger_log_lazy",
     "logger_log_start",
     "logger_log_end",
     "_setup_lifecycle",
@@ -85,6 +85,8 @@ def logger_sleep(self: Logger, duration: float, unit: str = ..., level: str = ..
 
 def logger_timer(self: Logger, name: str = ..., level: str = ...) -> Timer: ...
 
+def logger_log_lazy(self: Logger, level: int | str, template: str, *args: Any, **kwargs: Any) -> None: ...
+
 def logger_log_start(self: Logger, verbose: int = ...) -> None: ...
 
 def logger_log_end(self: Logger, verbose: int = ...) -> None: ...
@@ -27,7 +27,7 @@ def pause(
     resp: str | None
     if timeout is None:
         resp = input(msg)
-        self.debug(f"Resposta do usuário: {resp}")
+        self.debug("Resposta do usuário: %s", resp)
         return resp
 
     result: list[str | None] = []
@@ -42,5 +42,5 @@ def pause(
     if resp is None:
         self.debug("Entrada não recebida")
         return None
-    self.debug(f"Resposta do usuário: {resp}")
+    self.debug("Resposta do usuário: %s", resp)
     return resp
@@ -7,10 +7,13 @@ from ..helpers import _attach_screenshot
 __all__ = ["screen"]
 
 
-def screen(self: Logger, msg: str, *args, webdriver=None, **kwargs) -> None:
-    """Registra mensagem e captura de tela se possível."""
+def screen(self: Logger, msg: str, *args, webdriver=None, wait: bool = False, **kwargs) -> None:
+    """Registra mensagem e captura de tela se possível.
+
+    Com ``wait=True`` a imagem já está gravada quando a função retorna.
+    """
     screen_dir: Path | None = getattr(self, "_screen_dir", None)
     name: str = getattr(self, "_screen_name", "log")
     if screen_dir:
-        _attach_screenshot(self, name, screen_dir, webdriver)
+        _attach_screenshot(self, name, screen_dir, webdriver, wait=wait)
     self.log(35, msg, *args, stacklevel=2, **kwargs)
@@ -3,56 +3,85 @@
 Contem a classe ``DependencyManager`` e funcoes de log relacionadas.
 """
 
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+import functools
 import platform
-import pkg_resources  # type: ignore
-import time
+from importlib import metadata as importlib_metadata
 from logging import Logger
 from .progress import format_block  # will use relative import; but we haven't created progress yet
+from .helpers import _log_method
+
+_IMPORTANT_PKGS = frozenset(('requests', 'psutil', 'colorama', 'pyautogui'))
+
+@functools.lru_cache(maxsize=1)
+def _python_info() -> Mapping[str, Any]:
+    """Dados do interpretador; constantes durante todo o processo."""
+    return MappingProxyType({
+        'version': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'compiler': platform.python_compiler(),
+        'build': platform.python_build(),
+    })
+
+@functools.lru_cache(maxsize=1)
+def _system_info() -> Mapping[str, Any]:
+    """Dados do sistema operacional; constantes durante todo o processo."""
+    return MappingProxyType({
+        'os': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'node': platform.node(),
+    })
+
+@functools.lru_cache(maxsize=1)
+def _installed_packages() -> Mapping[str, str]:
+    """Mapeia nome normalizado -> versao das distribuicoes instaladas.
+
+    Os nomes seguem a chave do antigo ``pkg_resources`` (minusculos, ``_``
+    trocado por ``-``). As distribuicoes vem na ordem do ``sys.path``; como
+    no import, a primeira ocorrencia prevalece sobre copias sombreadas.
+
+    A varredura dos metadados e feita uma vez por processo e compartilhada
+    entre os ``DependencyManager``; ``force_update`` refaz a leitura.
+    """
+    packages: Dict[str, str] = {}
+    for dist in importlib_metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            packages.setdefault(name.lower().replace('_', '-'), dist.version)
+    return MappingProxyType(packages)
 
 class DependencyManager:
     """Coleta informacoes sobre dependencias e ambiente de execucao."""
     def __init__(self):
         self._cached_info: Optional[Dict[str, Any]] = None
-        self._last_update: float = 0
-        self._cache_duration: int = 300
 
     def get_environment_info(self, force_update: bool = False) -> Dict[str, Any]:
-        now = time.time()
-        if self._cached_info and not force_update and (now - self._last_update) < self._cache_duration:
+        if force_update:
+            _installed_packages.cache_clear()
+        elif self._cached_info is not None:
             return self._cached_info
+        # copias simples: o resultado continua serializavel (json, pickle)
         info = {
-            'python': {
-                'version': platform.python_version(),
-                'implementation': platform.python_implementation(),
-                'compiler': platform.python_compiler(),
-                'build': platform.python_build(),
-            },
-            'system': {
-                'os': platform.system(),
-                'release': platform.release(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'node': platform.node(),
-            },
-            'packages': {pkg.key: pkg.version for pkg in pkg_resources.working_set},
+            'python': dict(_python_info()),
+            'system': dict(_system_info()),
+            'packages': dict(_installed_packages()),
         }
         self._cached_info = info
-        self._last_update = now
         return info
 
 def logger_log_environment(self: Logger, level: str = 'INFO', return_block: bool = False) -> str | None:
     info = self._dep_manager.get_environment_info()  # type: ignore[attr-defined]
-    log_method = getattr(self, level.lower())
+    log_method = _log_method(self, level)
     linhas = [
         f"Python {info['python']['version']} ({info['python']['implementation']})",
         f"SO: {info['system']['os']} {info['system']['release']} ({info['system']['machine']})",
         "Pacotes Principais:",
     ]
-    important = ['requests', 'psutil', 'colorama', 'pyautogui']
-    for pkg in important:
-        if pkg in info['packages']:
-            linhas.append(f"  - {pkg}: {info['packages'][pkg]}")
+    packages = info['packages']
+    linhas.extend(f"  - {pkg}: {packages[pkg]}" for pkg in sorted(_IMPORTANT_PKGS & packages.keys()))
     bloco = format_block("AMBIENTE", linhas)
     if return_block:
         return bloco
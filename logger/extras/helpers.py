@@ -5,8 +5,13 @@ principal. Inclui inicialização do colorama para saída colorida, criação
 de diretórios de log e captura opcional de screenshots.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from typing import Callable
+import atexit
+import functools
+import threading
+import time
 from logging import Logger
 from colorama import init
 from types import ModuleType
@@ -18,9 +23,33 @@ except Exception:  # pragma: no cover - ambiente sem a lib
 pyautogui: ModuleType | None = _pyautogui
 
 
+# Nome do método de log por nível, evitando ``level.lower()`` a cada chamada
+_LEVEL_METHOD_NAMES = {
+    "DEBUG": "debug",
+    "INFO": "info",
+    "SUCCESS": "success",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "CRITICAL": "critical",
+    "SCREEN": "screen",
+}
+
+
+def _log_method(logger: Logger, level: str) -> Callable[..., None]:
+    """Retorna o método de ``logger`` correspondente ao nível ``level``."""
+    return getattr(logger, _LEVEL_METHOD_NAMES.get(level) or level.lower())
+
+
+_colorama_initialized = False
+
+
 def _init_colorama() -> None:
-    """Inicializa o colorama para colorir a saída do console."""
+    """Inicializa o colorama para colorir a saída do console (uma única vez)."""
+    global _colorama_initialized
+    if _colorama_initialized:
+        return
     init(autoreset=True)
+    _colorama_initialized = True
 
 
 def _setup_directories(base_dir: Path) -> tuple[Path, Path]:
@@ -46,14 +75,48 @@ def _setup_directories(base_dir: Path) -> tuple[Path, Path]:
 
 def _get_log_filename(name: str | None) -> str:
     """Gera um nome de arquivo de log baseado na data e hora atuais."""
-    ts = datetime.now().strftime("%d-%m-%Y %H-%M-%S")
+    ts = time.strftime("%d-%m-%Y %H-%M-%S")
     base = name or "log"
     return f"{base} - {ts}.log"
 
 
-def _attach_screenshot(logger: Logger, name: str, screen_dir: Path, webdriver=None) -> None:
+# Gravação das imagens em segundo plano. Um único worker mantém a ordem das
+# gravações, já que capturas do mesmo logger usam o mesmo arquivo.
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logger-screenshot")
+_MAX_PENDING_SCREENSHOTS = 8
+_pending_screenshots = 0
+_pending_lock = threading.Lock()
+atexit.register(_SCREENSHOT_POOL.shutdown, wait=True)
+
+
+def _save_screenshot(logger: Logger, save: Callable[[], object], path: Path) -> None:
+    try:
+        save()
+        logger.debug("Screenshot salva: %s", path)
+    except Exception as exc:  # pragma: no cover - funcionalidade opcional
+        logger.warning("Falha ao capturar screenshot: %s", exc)
+
+
+def _save_pending_screenshot(logger: Logger, save: Callable[[], object], path: Path) -> None:
+    global _pending_screenshots
+    try:
+        _save_screenshot(logger, save, path)
+    finally:
+        with _pending_lock:
+            _pending_screenshots -= 1
+
+
+def _attach_screenshot(
+    logger: Logger, name: str, screen_dir: Path, webdriver=None, wait: bool = False
+) -> "Future[None] | None":
     """Captura uma screenshot utilizando ``pyautogui`` ou Selenium.
 
+    A imagem é capturada na thread chamadora e gravada em disco em segundo
+    plano; o ``Future`` devolvido indica quando o arquivo existe. Com
+    ``wait=True`` (ou após o encerramento do pool, na saída do processo) a
+    gravação é feita na própria chamada. Com mais de
+    ``_MAX_PENDING_SCREENSHOTS`` gravações pendentes a captura é descartada.
+
     Parameters
     ----------
     logger : Logger
@@ -65,15 +128,35 @@ def _attach_screenshot(logger: Logger, name: str, screen_dir: Path, webdriver=No
         Diretório onde a imagem será salva.
     webdriver : opcional
         Objeto webdriver do Selenium para captura via navegador.
+    wait : bool, default False
+        Aguarda a gravação do arquivo antes de retornar.
     """
+    global _pending_screenshots
     path = screen_dir / f"{name}.png"
     try:
         if webdriver is not None:
-            webdriver.save_screenshot(str(path))
+            save = functools.partial(path.write_bytes, webdriver.get_screenshot_as_png())
         elif pyautogui is not None:
-            pyautogui.screenshot(str(path))
+            save = functools.partial(pyautogui.screenshot().save, str(path))
         else:
-            return
-        logger.debug(f"Screenshot salva: {path}")
+            return None
     except Exception as exc:  # pragma: no cover - funcionalidade opcional
-        logger.warning(f"Falha ao capturar screenshot: {exc}")
+        logger.warning("Falha ao capturar screenshot: %s", exc)
+        return None
+    if not wait:
+        with _pending_lock:
+            if _pending_screenshots >= _MAX_PENDING_SCREENSHOTS:
+                logger.warning("Screenshot descartada: %d gravações pendentes", _pending_screenshots)
+                return None
+            try:
+                future = _SCREENSHOT_POOL.submit(_save_pending_screenshot, logger, save, path)
+            except RuntimeError:
+                # pool já encerrado (saída do processo): grava na própria chamada
+                pass
+            else:
+                _pending_screenshots += 1
+                return future
+    _save_screenshot(logger, save, path)
+    done: Future[None] = Future()
+    done.set_result(None)
+    return done
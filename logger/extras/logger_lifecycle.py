@@ -2,7 +2,6 @@
 
 from logging import Logger
 import atexit
-from pathlib import Path
 from datetime import datetime
 import os
 import sys
@@ -11,6 +10,20 @@ from .progress import format_block, combine_blocks
 
 __all__ = ["logger_log_start", "logger_log_end", "_setup_lifecycle"]
 
+# ``sys.argv[0]`` não muda durante a execução
+_SCRIPT_NAME = os.path.basename(sys.argv[0]) if sys.argv else ""
+
+
+def _process_lines(status: str) -> list[str]:
+    """Linhas comuns dos banners de início e fim."""
+    folder = os.path.basename(os.getcwd())
+    now = datetime.now()
+    return [
+        status,
+        f"Data: {now:%d/%m/%Y} • Hora: {now:%H:%M:%S}",
+        f"Script: {_SCRIPT_NAME} • Pasta: {folder}",
+    ]
+
 
 def logger_log_start(
     self: Logger,
@@ -19,18 +32,7 @@ def logger_log_start(
     show_profiling: bool | None = None,
 ) -> None:
     """Exibe informações de início de execução."""
-    folder = Path(os.getcwd()).name
-    script = Path(sys.argv[0]).name
-    now = datetime.now()
-    data = now.strftime("%d/%m/%Y")
-    hora = now.strftime("%H:%M:%S")
-
-    lines = [
-        "PROCESSO INICIADO",
-        f"Data: {data} • Hora: {hora}",
-        f"Script: {script} • Pasta: {folder}",
-    ]
-    banner = format_block("INÍCIO", lines)
+    banner = format_block("INÍCIO", _process_lines("PROCESSO INICIADO"))
     blocks = [banner]
 
     if show_profiling is None:
@@ -60,12 +62,6 @@ def logger_log_end(
     show_profiling: bool | None = None,
 ) -> None:
     """Exibe informações de encerramento de execução."""
-    folder = Path(os.getcwd()).name
-    script = Path(sys.argv[0]).name
-    now = datetime.now()
-    data = now.strftime("%d/%m/%Y")
-    hora = now.strftime("%H:%M:%S")
-
     if show_profiling is None:
         show_profiling = getattr(self, "_show_profiling", False)
 
@@ -91,24 +87,19 @@ def logger_log_end(
     if profile_summary:
         blocks.append(profile_summary)
 
-    lines = [
-        "PROCESSO FINALIZADO",
-        f"Data: {data} • Hora: {hora}",
-        f"Script: {script} • Pasta: {folder}",
-    ]
-    banner = format_block("FIM", lines)
+    banner = format_block("FIM", _process_lines("PROCESSO FINALIZADO"))
     blocks.insert(0, banner)
     banner_final = combine_blocks(blocks)
     self.success(f"\n{banner_final}", extra={"plain": True})  # type: ignore[attr-defined]
+    # Garante que a fila dos arquivos foi gravada antes de retornar
+    for handler in self.handlers:
+        handler.flush()
 
     setattr(self, "_end_called", True)
 
 
 def _setup_lifecycle(logger: Logger) -> None:
-    """Acopla funções de ciclo de vida ao ``Logger``."""
-    setattr(Logger, "start", logger_log_start)
-    setattr(Logger, "end", logger_log_end)
-
+    """Prepara a instância do logger para o ciclo de vida (início/fim)."""
     # Flag para evitar múltiplas execuções de ``end``
     setattr(logger, "_end_called", False)
     # Controle padrão de exibição de profiling
@@ -122,3 +113,8 @@ def _setup_lifecycle(logger: Logger) -> None:
                 pass
 
     atexit.register(_auto_end)
+
+
+# Funções de ciclo de vida acopladas à classe ``Logger`` na importação
+setattr(Logger, "start", logger_log_start)
+setattr(Logger, "end", logger_log_end)
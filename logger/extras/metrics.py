@@ -6,6 +6,7 @@ execução e funções utilitárias vinculadas ao ``Logger``.
 
 from logging import Logger
 import time
+from .helpers import _log_method
 
 
 class MetricsTracker:
@@ -16,11 +17,11 @@ class MetricsTracker:
 
     def reset(self) -> None:
         """Reinicia o contador de tempo."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     def report(self) -> float:
         """Retorna o tempo decorrido desde o último ``reset``."""
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
 
 def logger_reset_metrics(self: Logger) -> None:
@@ -31,13 +32,15 @@ def logger_reset_metrics(self: Logger) -> None:
 def logger_report_metrics(self: Logger, level: str = "INFO") -> None:
     """Registra o tempo decorrido no nível de log especificado."""
     duration = self._metrics.report()  # type: ignore[attr-defined]
-    msg = f"⏱️ Duração total: {duration:.1f}s"
-    getattr(self, level.lower())(msg)
+    _log_method(self, level)("⏱️ Duração total: %.1fs", duration)
 
 
 def _setup_metrics(logger: Logger) -> None:
     """Liga o ``MetricsTracker`` à instância do logger."""
     metrics = MetricsTracker()
     setattr(logger, "_metrics", metrics)
-    setattr(Logger, "reset_metrics", logger_reset_metrics)
-    setattr(Logger, "report_metrics", logger_report_metrics)
+
+
+# Métodos de métricas acoplados à classe ``Logger`` na importação
+setattr(Logger, "reset_metrics", logger_reset_metrics)
+setattr(Logger, "report_metrics", logger_report_metrics)
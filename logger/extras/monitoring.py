@@ -6,21 +6,31 @@ vazamento de memória.
 """
 
 from logging import Logger
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, Tuple, Iterable
 import psutil
 import gc
+import time
 
 from .progress import format_block
+from .helpers import _log_method
 
 
 class SystemMonitor:
     """Realiza leitura de uso de CPU e memória do processo atual."""
 
+    #: Validade (s) da leitura usada em ``get_status``.
+    status_ttl: float = 1.0
+
     def __init__(self) -> None:
         self._process = psutil.Process()
         self._baseline_memory: float | None = None
         self._object_counts: Dict[str, int] | None = None
+        self._status_cache: Tuple[float, Tuple[float, float, float, float]] | None = None
+        # A primeira chamada de ``cpu_percent`` sempre retorna 0.0; inicia a
+        # janela de medição já na construção.
+        self._process.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None)
 
     def get_memory_usage(self) -> Tuple[float, float]:
         """Retorna memória do processo em MB e uso total do sistema em %."""
@@ -34,11 +44,30 @@ class SystemMonitor:
         sys_cpu = psutil.cpu_percent()
         return proc_cpu, sys_cpu
 
+    def get_status(self) -> Tuple[float, float, float, float]:
+        """Retorna CPU (processo, sistema) e memória (MB, %) com cache curto.
+
+        Leituras feitas dentro de ``status_ttl`` segundos reutilizam o valor
+        anterior, evitando novas consultas ao sistema.
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < self.status_ttl:
+            return cached[1]
+        proc_cpu, sys_cpu = self.get_cpu_usage()
+        proc_mem, sys_mem = self.get_memory_usage()
+        status = (proc_cpu, sys_cpu, proc_mem, sys_mem)
+        self._status_cache = (now, status)
+        return status
+
     def _count_objects(self) -> Dict[str, int]:
+        # Conta por tipo em C (``Counter`` + ``map``) e só depois agrupa por
+        # nome, evitando acessar ``__name__`` para cada objeto vivo.
+        by_type = Counter(map(type, gc.get_objects()))
         counts: Dict[str, int] = defaultdict(int)
-        for obj in gc.get_objects():
-            counts[type(obj).__name__] += 1
-        return counts
+        for obj_type, total in by_type.items():
+            counts[obj_type.__name__] += total
+        return dict(counts)
 
     def take_memory_snapshot(self) -> None:
         """Registra estado atual de uso de memória e contagem de objetos."""
@@ -63,8 +92,7 @@ class SystemMonitor:
 
 def logger_log_system_status(self: Logger, level: str = "INFO", return_block: bool = False) -> str | None:
     """Loga o status atual de CPU e memória."""
-    proc_mem, sys_mem = self._monitor.get_memory_usage()  # type: ignore[attr-defined]
-    proc_cpu, sys_cpu = self._monitor.get_cpu_usage()  # type: ignore[attr-defined]
+    proc_cpu, sys_cpu, proc_mem, sys_mem = self._monitor.get_status()  # type: ignore[attr-defined]
     lines = [
         f"CPU: Processo {proc_cpu:.1f}% • Sistema: {sys_cpu:.1f}%",
         f"Memória: {proc_mem:.1f}MB • Sistema: {sys_mem:.1f}%",
@@ -72,7 +100,7 @@ def logger_log_system_status(self: Logger, level: str = "INFO", return_block: bo
     block = format_block("STATUS DO SISTEMA", lines)
     if return_block:
         return block
-    getattr(self, level.lower())(f"\n{block}")
+    _log_method(self, level)(f"\n{block}")
     return None
 
 
@@ -129,7 +157,7 @@ def logger_check_memory_leak(
     block = format_block("VAZAMENTO DE MEMÓRIA", lines)
     if return_block:
         return block
-    getattr(self, level.lower())(f"\n{block}")
+    _log_method(self, level)(f"\n{block}")
     return None
 
 
@@ -137,6 +165,9 @@ def _setup_monitoring(logger: Logger) -> None:
     """Conecta o ``SystemMonitor`` à instância do logger."""
     monitor = SystemMonitor()
     setattr(logger, "_monitor", monitor)
-    setattr(Logger, "log_system_status", logger_log_system_status)
-    setattr(Logger, "memory_snapshot", logger_memory_snapshot)
-    setattr(Logger, "check_memory_leak", logger_check_memory_leak)
+
+
+# Métodos de monitoramento acoplados à classe ``Logger`` na importação
+setattr(Logger, "log_system_status", logger_log_system_status)
+setattr(Logger, "memory_snapshot", logger_memory_snapshot)
+setattr(Logger, "check_memory_leak", logger_check_memory_leak)
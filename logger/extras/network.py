@@ -5,12 +5,24 @@ from logging import Logger, getLogger
 from .dependency import DependencyManager, logger_log_environment
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor
-from collections import defaultdict
+from collections import defaultdict, deque
+from functools import lru_cache
 import time
 import socket
 import requests
+from requests.adapters import HTTPAdapter
 
 from .progress import format_block
+from .helpers import _log_method
+
+_MAX_LATENCY_SAMPLES = 100
+_EWMA_ALPHA = 0.1
+
+@lru_cache(maxsize=256)
+def _split_url(url: str) -> Tuple[str, str]:
+    """Retorna ``(scheme, netloc)`` de ``url``; as mesmas URLs costumam ser repetidas."""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
 
 class NetworkMonitor:
     def __init__(self, timeout: float = 1.0, logger: Logger | None = None):
@@ -20,66 +32,116 @@ class NetworkMonitor:
             'total_requests': 0,
             'total_errors': 0,
             'total_bytes': 0,
-            'latencies': [],
+            'latencies': deque(maxlen=_MAX_LATENCY_SAMPLES),
+            'sum_latency': 0.0,
+            'count_latency': 0,
+            'ewma_latency': 0.0,
         })
-        self._executor = ThreadPoolExecutor(max_workers=5)
+        self._executor: ThreadPoolExecutor | None = None
+        self._conn_cache: Dict[Tuple[str, int], Tuple[float, bool, Optional[float]]] = {}
+        self._conn_ttl = 5.0
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool de threads criado somente no primeiro uso."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=5)
+        return self._executor
 
-    def _validate_url(self, url: str) -> None:
-        parsed = urlparse(url)
-        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+    def _validate_url(self, url: str) -> str:
+        scheme, netloc = _split_url(url)
+        if scheme not in {"http", "https"} or not netloc:
             raise ValueError(f"URL inválida: {url}")
+        return netloc
 
     def check_connection(self, host: str = "8.8.8.8", port: int = 53, timeout: float | None = None) -> Tuple[bool, Optional[float]]:
+        key = (host, port)
+        cached = self._conn_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._conn_ttl:
+            return cached[1], cached[2]
         timeout = timeout if timeout is not None else self.timeout
         try:
-            start = time.time()
-            socket.create_connection((host, port), timeout=timeout)
-            return True, (time.time() - start) * 1000
+            start = time.monotonic()
+            socket.create_connection(key, timeout=timeout).close()
+            result: Tuple[bool, Optional[float]] = (True, (time.monotonic() - start) * 1000)
         except OSError:
-            return False, None
+            result = (False, None)
+        self._conn_cache[key] = (time.monotonic(), *result)
+        return result
 
-    def measure_latency(self, url: str, timeout: float | None = None) -> Dict[str, Any]:
-        self._validate_url(url)
+    def _fetch(self, url: str, timeout: float, head_only: bool) -> requests.Response:
+        """Executa a requisicao; com ``head_only`` o corpo nao e baixado."""
+        if not head_only:
+            return self._session.get(url, timeout=timeout)
+        response = self._session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code in (405, 501):
+            # servidor sem suporte a HEAD: GET em streaming, sem ler o corpo
+            response = self._session.get(url, timeout=timeout, stream=True)
+            response.close()
+        return response
+
+    def measure_latency(self, url: str, timeout: float | None = None, head_only: bool = True) -> Dict[str, Any]:
+        domain = self._validate_url(url)
         timeout = timeout if timeout is not None else self.timeout
         try:
-            start = time.time()
-            response = requests.get(url, timeout=timeout)
-            latency = (time.time() - start) * 1000
-            domain = urlparse(url).netloc
+            start = time.monotonic()
+            response = self._fetch(url, timeout, head_only)
+            latency = (time.monotonic() - start) * 1000
             metrics = self.metrics[domain]
             metrics['total_requests'] += 1
-            metrics['latencies'].append(latency)
-            metrics['total_bytes'] += len(response.content)
+            latencies = metrics['latencies']
+            if len(latencies) == latencies.maxlen:
+                # a amostra mais antiga sera descartada pelo append
+                metrics['sum_latency'] -= latencies[0]
+            else:
+                metrics['count_latency'] += 1
+            latencies.append(latency)
+            metrics['sum_latency'] += latency
+            if metrics['total_requests'] == 1:
+                metrics['ewma_latency'] = latency
+            else:
+                metrics['ewma_latency'] += _EWMA_ALPHA * (latency - metrics['ewma_latency'])
+            # sem Content-Length, um HEAD nao informa o tamanho (``None``)
+            length = response.headers.get('Content-Length')
+            content_size: int | None
+            if length:
+                content_size = int(length)
+            elif head_only:
+                content_size = None
+            else:
+                content_size = len(response.content)
+            if content_size is not None:
+                metrics['total_bytes'] += content_size
             return {
                 'latency': latency,
                 'status_code': response.status_code,
-                'content_size': len(response.content),
+                'content_size': content_size,
             }
         except requests.exceptions.Timeout as exc:
-            domain = urlparse(url).netloc
             self.metrics[domain]['total_errors'] += 1
-            self.logger.error(f"Timeout ao acessar {url}: {exc}")
+            self.logger.error("Timeout ao acessar %s: %s", url, exc)
             return {'error': str(exc), 'type': 'Timeout'}
         except requests.exceptions.ConnectionError as exc:
-            domain = urlparse(url).netloc
             self.metrics[domain]['total_errors'] += 1
             msg = str(exc)
             if "NameResolutionError" in msg or "getaddrinfo failed" in msg:
                 self.logger.warning(
-                    f"Sem conectividade para resolver {domain}: {msg}"
+                    "Sem conectividade para resolver %s: %s", domain, msg
                 )
                 return {"error": "sem conectividade", "type": "ConnectionError"}
-            self.logger.error(f"Erro de conexão ao acessar {url}: {msg}")
+            self.logger.error("Erro de conexão ao acessar %s: %s", url, msg)
             return {"error": msg, "type": "ConnectionError"}
         except requests.RequestException as exc:
-            domain = urlparse(url).netloc
             self.metrics[domain]['total_errors'] += 1
-            self.logger.error(f"Erro ao acessar {url}: {exc}")
+            self.logger.error("Erro ao acessar %s: %s", url, exc)
             return {'error': str(exc), 'type': type(exc).__name__}
         except Exception as exc:  # pragma: no cover - unforeseen errors
-            domain = urlparse(url).netloc
             self.metrics[domain]['total_errors'] += 1
-            self.logger.exception(f"Falha inesperada ao acessar {url}: {exc}")
+            self.logger.exception("Falha inesperada ao acessar %s: %s", url, exc)
             return {'error': str(exc), 'type': 'Exception'}
 
 def logger_check_connectivity(
@@ -91,13 +153,11 @@ def logger_check_connectivity(
 ) -> str | None:
     """Testa a conectividade geral e opcionalmente múltiplas URLs."""
     connected, latency = self._net_monitor.check_connection(timeout=timeout)  # type: ignore[attr-defined]
-    log_method = getattr(self, level.lower())
-    linhas: list[str] = []
+    log_method = _log_method(self, level)
     if connected:
-        linhas.append(f"Status: Conectado • Latência: {latency:.1f}ms")
+        linhas = [f"Status: Conectado • Latência: {latency:.1f}ms"]
     else:
-        linhas.append("Sem conexão com a internet")
-        bloco = format_block("CONECTIVIDADE", linhas)
+        bloco = format_block("CONECTIVIDADE", ("Sem conexão com a internet",))
         if return_block:
             return bloco
         log_method(f"\n{bloco}")
@@ -115,10 +175,12 @@ def logger_check_connectivity(
         try:
             metrics = self._net_monitor.measure_latency(url, timeout=timeout)  # type: ignore[attr-defined]
             if "latency" in metrics:
-                linhas.append(f"URL Testada: {url}")
-                linhas.append(
-                    f"↳ Latência: {metrics['latency']:.1f}ms • Status: {metrics['status_code']} • Tamanho: {metrics['content_size']/1024:.1f}KB"
-                )
+                size = metrics.get('content_size')
+                tamanho = f"{size/1024:.1f}KB" if size is not None else "desconhecido"
+                linhas.extend((
+                    f"URL Testada: {url}",
+                    f"↳ Latência: {metrics['latency']:.1f}ms • Status: {metrics['status_code']} • Tamanho: {tamanho}",
+                ))
             else:
                 linhas.append(f"Erro ao acessar {url}: {metrics['error']}")
         except Exception as e:
@@ -133,18 +195,20 @@ def logger_check_connectivity(
 def logger_get_network_metrics(self: Logger, domain: str | None = None) -> Dict[str, Any]:
     if domain:
         metrics = self._net_monitor.metrics[domain]  # type: ignore[attr-defined]
-        if metrics['latencies']:
-            avg_latency = sum(metrics['latencies']) / len(metrics['latencies'])
-            metrics['average_latency'] = avg_latency
+        if metrics['count_latency']:
+            metrics['average_latency'] = metrics['sum_latency'] / metrics['count_latency']
         return metrics
     return dict(self._net_monitor.metrics)  # type: ignore[attr-defined]
 
+
 def _setup_dependencies_and_network(logger: Logger) -> None:
     dep_manager = DependencyManager()
     net_monitor = NetworkMonitor()
     setattr(logger, "_dep_manager", dep_manager)
     setattr(logger, "_net_monitor", net_monitor)
-    setattr(Logger, "log_environment", logger_log_environment)
-    setattr(Logger, "check_connectivity", logger_check_connectivity)
-    setattr(Logger, "get_network_metrics", logger_get_network_metrics)
+
+# Metodos de rede/ambiente acoplados a classe ``Logger`` na importacao
+setattr(Logger, "log_environment", logger_log_environment)
+setattr(Logger, "check_connectivity", logger_check_connectivity)
+setattr(Logger, "get_network_metrics", logger_get_network_metrics)
 
@@ -4,6 +4,7 @@ import builtins
 import sys
 from contextlib import contextmanager
 from logging import Logger
+from .helpers import _log_method
 
 class PrintCapture:
     """Substitui a funcao print para redirecionar saidas ao logger."""
@@ -21,6 +22,7 @@ class PrintCapture:
         self.log_level = level
         self.prefix = prefix
         self.active = True
+        log_method = _log_method(logger, level)
         if self.original_print is None:
             self.original_print = builtins.print
         def new_print(*args, **kwargs):
@@ -31,10 +33,7 @@ class PrintCapture:
             if file is not sys.stdout:
                 return self.original_print(*args, file=file, sep=sep, end=end, flush=flush)
             message = sep.join(str(arg) for arg in args)
-            log_method = getattr(self.logger, self.log_level.lower())
-            # log_method(f"-------------- ❌ Evite o Uso de Print ❌ --------------")
-            log_method(f"{self.prefix}{message}")
-            # log_method(f"-------------------------------------------------------")
+            log_method("%s%s", self.prefix, message)
             if end != '\n':
                 self.original_print(*args, sep=sep, end=end, flush=flush)
         builtins.print = new_print
@@ -1,41 +1,57 @@
 """progress.py - Barra de progresso e funcoes utilitarias.
 """
 
+from functools import lru_cache
 from typing import Iterable, List
 from logging import Logger
 import sys
 import time
 from wcwidth import wcswidth
+from .helpers import _log_method
 
 # ---- Funcoes auxiliares ----
 
+_BLOCK_INDENT = " " * 2
+
+# barra pre-montada; cada redesenho apenas fatia estas strings
+_BAR_WIDTH = 20
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+
+
+@lru_cache(maxsize=1024)
+def _line_width(line: str) -> int:
+    """Largura de exibicao de ``line`` (cache: linhas de banner se repetem)."""
+    return wcswidth(line)
+
+
 def format_block(title: str, lines):
-    space = " " * 2
+    space = _BLOCK_INDENT
     title_str = f"[{title}]"
-    title_w = wcswidth(title_str)
-    content_ws = [wcswidth(line) for line in lines] if lines else [0]
+    title_w = _line_width(title_str)
+    content_ws = [_line_width(line) for line in lines] if lines else [0]
     max_content_w = max(content_ws)
     inner_width = max(title_w, max_content_w)
     total_w = inner_width + 4
     pad_total = total_w - title_w - 2
     left = pad_total // 2
     right = pad_total - left
-    topo = f"{space}╭{'─'*left}{title_str}{'─'*right}╮"
-    corpo = []
-    for line, w in zip(lines, content_ws):
-        falta = inner_width - w
-        corpo.append(f"{space}│ {line}{' '*falta} │")
-    base = f"{space}╰{'─'*(total_w-2)}╯"
-    return "\n".join([topo] + corpo + [base])
+    topo = "".join((space, "╭", "─" * left, title_str, "─" * right, "╮"))
+    corpo = [
+        f"{space}│ {line.ljust(len(line) + inner_width - w)} │"
+        for line, w in zip(lines, content_ws)
+    ]
+    base = "".join((space, "╰", "─" * (total_w - 2), "╯"))
+    return "\n".join([topo, *corpo, base])
 
 def combine_blocks(blocks: List[str]) -> str:
     """Combine multiple formatted blocks horizontally."""
     split_blocks = [b.split("\n") for b in blocks]
-    widths = [max(wcswidth(line) for line in bl) for bl in split_blocks]
+    widths = [max(_line_width(line) for line in bl) for bl in split_blocks]
     height = max(len(bl) for bl in split_blocks)
     padded = []
     for bl, w in zip(split_blocks, widths):
-        pad_lines = [line + " " * (w - wcswidth(line)) for line in bl]
+        pad_lines = [line + " " * (w - _line_width(line)) for line in bl]
         pad_lines += [" " * w] * (height - len(pad_lines))
         padded.append(pad_lines)
     combined_lines = ["  ".join(parts) for parts in zip(*padded)]
@@ -59,12 +75,14 @@ class LoggerProgressBar:
         self.unit = unit
         self.log_interval = log_interval
         self.log_level = log_level
+        self._log_method = _log_method(logger, log_level)
         self.n = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_log_time = self.start_time
         self.last_print_time = self.start_time
         self.closed = False
         self.last_line_len = 0
+        self._is_tty = sys.stdout.isatty()
         # contexto automatico
         self._ctx_cm = None
         if hasattr(self.logger, "context"):
@@ -77,21 +95,27 @@ class LoggerProgressBar:
         if self.closed:
             return
         self.n += n
-        now = time.time()
-        if now - self.last_log_time >= self.log_interval and self.n != self.total:
-            self._log_progress()
-            self.last_log_time = now
-            self._print_progress()
+        now = time.monotonic()
+        log_due = now - self.last_log_time >= self.log_interval and self.n != self.total
+        print_due = self._is_tty and (
+            log_due or self.n == self.total or now - self.last_print_time >= 0.2
+        )
+        if not (log_due or print_due):
             return
-        if self.n == self.total or now - self.last_print_time >= 0.2:
-            self._print_progress()
+        info = self._get_progress_info(now)
+        if log_due:
+            self._log_progress(info=info)
+            self.last_log_time = now
+        if print_due:
+            self._print_progress(info=info)
             self.last_print_time = now
 
     def close(self):
         if not self.closed:
             self.closed = True
-            self._log_progress(final=True)
-            self._print_progress(final=True)
+            info = self._get_progress_info()
+            self._log_progress(final=True, info=info)
+            self._print_progress(final=True, info=info)
             if getattr(self.logger, "_active_pbar", None) is self:
                 setattr(self.logger, "_active_pbar", None)
             if self._ctx_cm is not None:
@@ -120,12 +144,13 @@ class LoggerProgressBar:
         self.close()
 
     # internal helpers
-    def _format_bar(self, pct: float, width: int = 20) -> str:
-        filled = int(width * pct)
-        return '█' * filled + '░' * (width - filled)
+    def _format_bar(self, pct: float) -> str:
+        filled = int(_BAR_WIDTH * pct)
+        return _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
 
-    def _get_progress_info(self):
-        now = time.time()
+    def _get_progress_info(self, now: float | None = None):
+        if now is None:
+            now = time.monotonic()
         elapsed = now - self.start_time
         if self.total is None or self.total == 0:
             pct = 0
@@ -146,33 +171,34 @@ class LoggerProgressBar:
             'rate_str': f"{rate:.1f} {self.unit}/s",
         }
 
-    def _log_progress(self, initial: bool = False, final: bool = False):
-        info = self._get_progress_info()
+    def _log_progress(self, initial: bool = False, final: bool = False, info=None):
+        if info is None:
+            info = self._get_progress_info()
         if initial:
             message = f"⏱️ Iniciando: {self.desc} (0/{info['total']} {self.unit})"
         elif final:
             message = f"✅ Concluído: {self.desc} ({info['count']}/{info['total']} {self.unit})"
         else:
             message = (f"📊 {self.desc}: [{info['bar']}] {info['count']}/{info['total']} {self.unit} ({info['pct']:.1f}%)")
-        log_method = getattr(self.logger, self.log_level.lower())
-        log_method(message)
+        self._log_method(message)
 
     def _clear_line(self):
-        if not sys.stdout.isatty():
+        if not self._is_tty:
             return
         sys.stdout.write('\r' + ' ' * self.last_line_len + '\r')
 
-    def _print_progress(self, final: bool = False):
-        if not sys.stdout.isatty():
+    def _print_progress(self, final: bool = False, info=None):
+        if not self._is_tty:
             return
-        info = self._get_progress_info()
-        self._clear_line()
+        if info is None:
+            info = self._get_progress_info()
         line = (f"{self.desc}: [{info['bar']}] {info['count']}/{info['total']} ({info['pct']:.1f}%) {info['rate_str']}")
         max_len = 80
         if len(line) > max_len:
             line = line[:max_len-3] + '...'
+        # apaga e redesenha numa unica escrita: o padding cobre a linha anterior
+        sys.stdout.write(f"\r{line:<{self.last_line_len}}")
         self.last_line_len = len(line)
-        sys.stdout.write(line)
         sys.stdout.flush()
         if final and self.leave:
             sys.stdout.write('\n')
@@ -0,0 +1,34 @@
+"""lazy.py - Registro com avaliação tardia dos argumentos."""
+
+import logging
+from logging import Logger
+from typing import Any
+
+__all__ = ["logger_log_lazy"]
+
+
+def logger_log_lazy(self: Logger, level: int | str, template: str, *args: Any, **kwargs: Any) -> None:
+    """Registra ``template % args`` apenas se ``level`` estiver habilitado.
+
+    Parameters
+    ----------
+    level : int | str
+        Nível numérico ou nome, sem diferenciar maiúsculas (``"debug"``,
+        ``"SUCCESS"``...).
+    template : str
+        Mensagem no estilo ``%`` interpolada só quando o registro é formatado.
+    *args
+        Argumentos da mensagem. Argumentos chamáveis são executados apenas
+        quando o nível está habilitado, evitando trabalho em registros
+        descartados.
+    """
+    if isinstance(level, str):
+        value = logging.getLevelName(level.upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Nível de log desconhecido: {level!r}")
+        level = value
+    if not self.isEnabledFor(level):
+        return
+    if args:
+        args = tuple(arg() if callable(arg) else arg for arg in args)
+    self._log(level, template, args, **kwargs)
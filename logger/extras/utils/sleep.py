@@ -2,9 +2,18 @@
 
 from logging import Logger
 import time
+from ..helpers import _log_method
 
 __all__ = ["logger_sleep"]
 
+# unidade -> (fator em segundos, nome exibido)
+_UNIT_TO_SECONDS = {
+    "s": (1.0, "segundo(s)"),
+    "ms": (1e-3, "milissegundo(s)"),
+    "min": (60.0, "minuto(s)"),
+    "h": (3600.0, "hora(s)"),
+}
+
 
 def logger_sleep(self: Logger, duration: float, unit: str = "s", level: str = "DEBUG", message: str | None = None) -> None:
     """Suspende a execução por determinado tempo com registro opcional.
@@ -21,9 +30,8 @@ def logger_sleep(self: Logger, duration: float, unit: str = "s", level: str = "D
     message : str, opcional
         Mensagem customizada para exibição.
     """
-    units = {"s": 1, "ms": 0.001, "min": 60, "h": 3600}
-    seconds = duration * units.get(unit, 1)
-    unit_name = {"s": "segundo(s)", "ms": "milissegundo(s)", "min": "minuto(s)", "h": "hora(s)"}.get(unit, "segundo(s)")
+    factor, unit_name = _UNIT_TO_SECONDS.get(unit, _UNIT_TO_SECONDS["s"])
+    seconds = duration * factor
     msg = message or f"Aguardando {duration} {unit_name}"
-    getattr(self, level.lower())(f"⏳ {msg}")
+    _log_method(self, level)("⏳ %s", msg)
     time.sleep(seconds)
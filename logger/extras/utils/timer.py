@@ -2,6 +2,7 @@
 
 from logging import Logger
 import time
+from ..helpers import _log_method
 
 __all__ = ["Timer", "logger_timer"]
 
@@ -17,12 +18,14 @@ class Timer:
 
     def __enter__(self):
         self._start = time.time()
-        getattr(self.logger, self.level.lower())(f"⏱️ Iniciando {self.name} ...")
+        _log_method(self.logger, self.level)("⏱️ Iniciando %s ...", self.name)
         return self
 
     def __exit__(self, exc_type, exc, tb):
         duration = time.time() - self._start
-        getattr(self.logger, self.level.lower())(f"⏱️ {self.name} concluída em {duration:.1f}s")
+        _log_method(self.logger, self.level)(
+            "⏱️ %s concluída em %.1fs", self.name, duration
+        )
 
 
 def logger_timer(self: Logger, name: str = "Tarefa", level: str = "INFO") -> Timer:
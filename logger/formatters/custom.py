@@ -6,14 +6,15 @@ Uso:
     from logger.formatters.custom import CustomFormatter, AutomaticTracebackLogger, _define_custom_levels
 """
 
+import functools
 import logging
+import os
 from logging import Formatter, Logger
-from pathlib import Path
 from colorama import Fore, Style
 import threading
-import inspect
 import sys
-from contextvars import ContextVar
+import time
+from types import CodeType
 
 
 from logger.extras.helpers import _init_colorama
@@ -26,16 +27,32 @@ __all__ = [
 ]
 
 # Funcoes internas ignoradas na geracao da call chain
-_INTERNAL_FUNCS = {
+_INTERNAL_FUNCS = frozenset({
     'format', '_extract_call_chain', '_init_colorama',
     '_define_custom_levels', '_setup_directories', '_get_log_filename',
     '_attach_screenshot', 'screen',
     'logger_progress', '__call__', '_log_progress', 'log_with_context',
     '_log_start', '_log_end', 'emit'
-}
+})
 
-# Contexto para filtragem de funcoes internas
-_log_context: ContextVar[list[str]] = ContextVar('log_context', default=[])
+# Pacotes (primeiro componente do ``__name__``) ignorados na call chain
+_IGNORED_PACKAGES = frozenset({'logging', 'inspect', 'colorama', 'threading', 'logger'})
+
+# Ident da thread principal, para evitar ``threading.current_thread()``
+_MAIN_IDENT = threading.main_thread().ident
+
+# Ultimo ``asctime`` gerado: (segundo inteiro, datefmt, texto). Compartilhado
+# pelos formatters, pois registros do mesmo segundo produzem o mesmo texto.
+_LAST_ASCTIME: tuple[int, str | None, str] = (-1, None, '')
+
+# Defina como ``False`` para desligar a extracao da call chain; nesse caso
+# ``call_chain`` recebe apenas ``record.funcName``.
+_CALL_CHAIN_ENABLED = True
+
+@functools.lru_cache(maxsize=512)
+def _classify_path(pathname: str) -> tuple[bool, str]:
+    """Indica se ``pathname`` pertence ao pacote e devolve seu nome base."""
+    return "logger" in pathname.lower(), os.path.basename(pathname)
 
 class CustomFormatter(Formatter):
     """Formatter com emojis e cores para saida humanizada."""
@@ -58,44 +75,118 @@ class CustomFormatter(Formatter):
         'SCREEN': Fore.MAGENTA,
     }
 
-    def __init__(self, fmt=None, datefmt=None, style="%", use_color=True):
+    def __init__(self, fmt=None, datefmt=None, style="%", use_color=True, render=None):
         super().__init__(fmt=fmt, datefmt=datefmt, style=style)
         self.use_color = use_color
+        # ``render`` monta a linha direto dos atributos do registro (formato
+        # pre-compilado); sem ele, formatos ``{`` usam ``format_map`` sem
+        # copiar o ``__dict__`` do registro.
+        self._render = render
+        self._format_map = (
+            self._fmt.format_map
+            if render is None and isinstance(self._style, logging.StrFormatStyle)
+            else None
+        )
+        self._uses_call_chain = "call_chain" in self._fmt if self._fmt else False
+        # Cor do contexto resolvida uma vez, conforme ``use_color``
+        if use_color:
+            self._ctx_open, self._ctx_close = Fore.LIGHTYELLOW_EX, Style.RESET_ALL
+        else:
+            self._ctx_open = self._ctx_close = ''
+        # formatters com a mesma configuracao produzem a mesma saida
+        self._cache_key = (self._fmt, datefmt, use_color)
+        # emoji, nivel colorido, nivel e padding pre-calculados por nivel
+        self._level_cache: dict[str, tuple[str, str, str, str]] = {
+            name: self._level_parts(name) for name in self.LEVEL_EMOJI
+        }
+
+    def _level_parts(self, levelname: str) -> tuple[str, str, str, str]:
+        emoji = self.LEVEL_EMOJI.get(levelname, '🔹')
+        color = self.LEVEL_COLOR.get(levelname, '') if self.use_color else ''
+        suffix = Style.RESET_ALL if color else ''
+        label = f"[{levelname}]"
+        return emoji, f"{color}{label}{suffix}", label, ' ' * (11 - len(label))
+
+    def formatMessage(self, record):
+        if self._render is not None:
+            return self._render(record)
+        if self._format_map is not None:
+            return self._format_map(record.__dict__)
+        return super().formatMessage(record)
+
+    def formatTime(self, record, datefmt=None):
+        global _LAST_ASCTIME
+        if not datefmt or self.converter is not time.localtime:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, last_datefmt, text = _LAST_ASCTIME
+        if second != last_second or datefmt != last_datefmt:
+            text = time.strftime(datefmt, time.localtime(second))
+            _LAST_ASCTIME = (second, datefmt, text)
+        return text
 
     def format(self, record):
         if getattr(record, 'plain', False):
             return record.getMessage()
+        cache = record.__dict__.get('_fmt_cache')
+        if cache is None:
+            cache = record._fmt_cache = {}
+        else:
+            cached = cache.get(self._cache_key)
+            if cached is not None:
+                return cached
         original_levelname = record.levelname
         original_levelname_color = getattr(record, 'levelname_color', None)
         original_msg = record.msg
         original_args = record.args
         try:
+            # mensagem interpolada uma vez e reaproveitada pelos demais handlers
+            message = record.__dict__.get('_cached_msg')
+            if message is None:
+                message = record._cached_msg = record.getMessage()
             context = getattr(record, 'context', '')
             if context:
-                ctx_disp = (
-                    f"{Fore.LIGHTYELLOW_EX}{context}{Style.RESET_ALL}"
-                    if self.use_color else context
-                )
-                record.msg = f"[{ctx_disp}] {record.getMessage()}"
-                record.args = ()
-            record.emoji = self.LEVEL_EMOJI.get(original_levelname, '🔹')
-            color = self.LEVEL_COLOR.get(original_levelname, '') if self.use_color else ''
-            suffix = Style.RESET_ALL if self.use_color and color else ''
-            record.levelname_color = f"{color}[{original_levelname}]{suffix}"
-            record.levelname = f"[{original_levelname}]"
-            pad = 11
-            record.levelpad = ' ' * (pad - len(record.levelname))
-            record.thread = threading.current_thread().name
-            record.thread_disp = '' if record.thread == 'MainThread' else f"[T:{record.thread}]"
-            record.call_chain = _extract_call_chain(record)
-            if "logger" not in record.pathname.lower():
-                filename = Path(record.pathname).name
+                message = f"[{self._ctx_open}{context}{self._ctx_close}] {message}"
+            record.msg = message
+            record.args = ()
+            parts = self._level_cache.get(original_levelname)
+            if parts is None:
+                parts = self._level_parts(original_levelname)
+                self._level_cache[original_levelname] = parts
+            (
+                record.emoji,
+                record.levelname_color,
+                record.levelname,
+                record.levelpad,
+            ) = parts
+            # ``record.thread`` guarda o ident da thread de origem; apos o
+            # primeiro formatter ele ja contem o nome.
+            thread = record.thread
+            if thread == _MAIN_IDENT or thread == 'MainThread':
+                record.thread = 'MainThread'
+                record.thread_disp = ''
+            else:
+                record.thread = record.threadName or threading.current_thread().name
+                record.thread_disp = f"[T:{record.thread}]"
+            is_internal, filename = _classify_path(record.pathname)
+            # A call chain so e necessaria se o formato a exibe ou se o
+            # registro veio de fora do pacote (usada em ``meta``).
+            caller_chain = getattr(record, 'caller_chain', None)
+            if caller_chain is not None:
+                # extraida na thread de origem (``CallChainQueueHandler``)
+                record.call_chain = caller_chain
+            elif _CALL_CHAIN_ENABLED and (self._uses_call_chain or not is_internal):
+                record.call_chain = _extract_call_chain(record)
+            else:
+                record.call_chain = record.funcName
+            if not is_internal:
                 record.meta = f"⮕ 📁{filename}:{record.lineno} | 🧭 {record.call_chain}"
             else:
                 record.meta = ""
             mensagem_formatada = super().format(record)
             if record.meta:
                 mensagem_formatada += f" {record.meta}"
+            cache[self._cache_key] = mensagem_formatada
             return mensagem_formatada
         finally:
             record.msg = original_msg
@@ -104,12 +195,20 @@ class CustomFormatter(Formatter):
             if original_levelname_color is not None:
                 record.levelname_color = original_levelname_color
 
+if sys.version_info >= (3, 11):
+    _current_exception = sys.exception
+else:  # pragma: no cover - Python < 3.11
+    def _current_exception():
+        return sys.exc_info()[1]
+
+
 class AutomaticTracebackLogger(logging.Logger):
     """Logger que captura automaticamente exceptions para incluir stack trace."""
     def error(self, msg, *args, **kwargs):
-        exc_info = sys.exc_info()
-        if exc_info[0] is not None:
-            kwargs['exc_info'] = exc_info
+        if 'exc_info' not in kwargs:
+            exc = _current_exception()
+            if exc is not None:
+                kwargs['exc_info'] = exc
         super().error(msg, *args, **kwargs)
 
     def exception(self, msg, *args, **kwargs):
@@ -117,33 +216,58 @@ class AutomaticTracebackLogger(logging.Logger):
         self.error(msg, *args, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
-        exc_info = sys.exc_info()
-        if exc_info[0] is not None:
-            kwargs['exc_info'] = exc_info
+        if 'exc_info' not in kwargs:
+            exc = _current_exception()
+            if exc is not None:
+                kwargs['exc_info'] = exc
         super().critical(msg, *args, **kwargs)
 
 
-def _extract_call_chain(record) -> str:
-    """Extrai a cadeia de chamadas ignorando funcoes internas."""
-    chain = []
-    for frame_info in inspect.stack():
-        func = frame_info.function
-        module = frame_info.frame.f_globals.get('__name__', '')
-        filename = frame_info.filename
-        if func in _INTERNAL_FUNCS:
-            continue
-        if module.startswith(('logging', 'inspect', 'colorama', 'threading')):
-            continue
-        if module == __name__ or module.startswith('logger.'):
-            continue
-        if not filename.endswith('.py'):
-            continue
-        chain.append(func)
+# Nome exibido por objeto de codigo, chaveado por ``id(code)`` (codigos iguais
+# de modulos distintos sao ``==``); o codigo no valor mantem o id valido.
+# Limitado a ``_FRAME_NAMES_MAX`` entradas para nao reter codigo de
+# ``exec``/modulos recarregados indefinidamente.
+_FRAME_NAMES: dict[int, tuple[CodeType, str | None]] = {}
+_FRAME_NAMES_MAX = 2048
+
+
+def _frame_name(code: CodeType, f_globals: dict) -> str | None:
+    func = code.co_name
+    if func in _INTERNAL_FUNCS:
+        return None
+    module = f_globals.get('__name__', '')
+    if module.partition('.')[0] in _IGNORED_PACKAGES:
+        return None
+    if not code.co_filename.endswith('.py'):
+        return None
+    return func
+
+
+@functools.lru_cache(maxsize=2048)
+def _chain_for(names: tuple[str, ...]) -> str:
     unique: list[str] = []
-    for f in reversed(chain):
+    for f in reversed(names):
         if not unique or unique[-1] != f:
             unique.append(f)
-    return '>'.join(unique) or record.funcName
+    return '>'.join(unique)
+
+
+def _extract_call_chain(record) -> str:
+    """Extrai a cadeia de chamadas ignorando funcoes internas."""
+    chain = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        entry = _FRAME_NAMES.get(id(code))
+        if entry is None or entry[0] is not code:
+            if len(_FRAME_NAMES) >= _FRAME_NAMES_MAX:
+                _FRAME_NAMES.clear()
+            entry = _FRAME_NAMES[id(code)] = (code, _frame_name(code, frame.f_globals))
+        name = entry[1]
+        if name is not None:
+            chain.append(name)
+        frame = frame.f_back
+    return _chain_for(tuple(chain)) or record.funcName
 
 
 def _define_custom_levels():
@@ -1,5 +1,12 @@
 import logging
+import time
+from .file_handler import BufferedFileHandler
 from .progress_handler import ProgressStreamHandler
+from .queue_handler import (
+    CallChainQueueHandler,
+    _setup_async_handlers,
+    _stop_listener,
+)
 
 
 class FileOnlyFilter(logging.Filter):
@@ -9,4 +16,45 @@ class FileOnlyFilter(logging.Filter):
         """Return ``False`` for messages flagged as file only."""
         return not getattr(record, "file_only", False)
 
-__all__ = ["ProgressStreamHandler", "FileOnlyFilter"]
+
+class DedupFilter(logging.Filter):
+    """Filter that drops repeated console messages inside a short window.
+
+    Only records below ``WARNING`` are considered, so problems are never
+    hidden; the file handlers keep every record. Repeats are tracked per
+    emitting thread (``record.thread``), since the filter itself runs on the
+    queue listener thread.
+    """
+
+    def __init__(self, window: float = 0.05, max_keys: int = 1024) -> None:
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self._last: dict[tuple[int | None, str, int, str], float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: D401
+        """Return ``False`` when the same message was shown within ``window``."""
+        if record.levelno >= logging.WARNING:
+            return True
+        message = record.__dict__.get("_cached_msg")
+        if message is None:
+            message = record._cached_msg = record.getMessage()
+        key = (record.thread, record.name, record.levelno, message)
+        now = time.monotonic()
+        last = self._last.get(key)
+        if last is not None and now - last < self.window:
+            return False
+        if len(self._last) >= self.max_keys:
+            self._last.clear()
+        self._last[key] = now
+        return True
+
+__all__ = [
+    "ProgressStreamHandler",
+    "BufferedFileHandler",
+    "FileOnlyFilter",
+    "DedupFilter",
+    "CallChainQueueHandler",
+    "_setup_async_handlers",
+    "_stop_listener",
+]
@@ -0,0 +1,58 @@
+"""file_handler.py - Handler de arquivo com escrita em buffer."""
+
+import logging
+from logging import FileHandler
+
+# Tamanho do buffer de escrita dos arquivos de log
+_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedFileHandler(FileHandler):
+    """FileHandler que só descarrega o buffer em registros importantes.
+
+    Registros abaixo de ``flush_level`` ficam no buffer de ``buffer_size``
+    bytes; o ``QueueListener`` descarrega quando a fila esvazia e o
+    ``close`` garante a gravação final.
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        *,
+        buffer_size: int = _BUFFER_SIZE,
+        flush_level: int = logging.WARNING,
+    ) -> None:
+        # buffering=0 so e aceito em modo binario; em texto o open falharia
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size deve ser >= 1, recebido {buffer_size}")
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding, delay, errors)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            if self.mode != "w" or not getattr(self, "_closed", False):
+                self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:  # pragma: no cover - mesmo tratamento do logging
+            raise
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,146 @@
+"""queue_handler.py - Escrita assíncrona dos handlers de arquivo.
+
+Os registros são enfileirados na thread chamadora e gravados em disco por um
+``QueueListener`` em segundo plano.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable
+
+from logger.formatters import custom
+
+# Intervalo mínimo entre descargas dos arquivos feitas pelo listener
+_FLUSH_INTERVAL = 0.2
+
+
+class CallChainQueueHandler(QueueHandler):
+    """QueueHandler que preserva a call chain da thread de origem.
+
+    A cadeia de chamadas depende da pilha de quem registrou a mensagem, por
+    isso é extraída aqui, antes de o registro mudar de thread. A formatação
+    final fica a cargo dos handlers do ``QueueListener``.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # saídas do console não valem para a cópia enviada aos arquivos
+        record.__dict__.pop("_fmt_cache", None)
+        message = record.__dict__.get("_cached_msg")
+        record.msg = message if message is not None else record.getMessage()
+        record.args = None
+        if custom._CALL_CHAIN_ENABLED:
+            record.caller_chain = custom._extract_call_chain(record)
+        else:
+            record.caller_chain = record.funcName
+        return record
+
+    listener: "QueueListener | None" = None
+
+    def _listener_alive(self) -> bool:
+        thread = getattr(self.listener, "_thread", None)
+        return thread is not None and thread.is_alive()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        listener = self.listener
+        if listener is None or self._listener_alive():
+            super().emit(record)
+            return
+        # Listener encerrado (saída do processo) ou ausente no filho de um
+        # ``fork``: grava na thread chamadora para não perder o registro.
+        try:
+            listener.handle(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Aguarda a gravação dos registros enfileirados e descarrega os arquivos."""
+        log_queue = self.queue
+        # só espera enquanto houver um listener vivo para consumir a fila
+        while log_queue.unfinished_tasks and self._listener_alive():  # type: ignore[attr-defined]
+            with log_queue.all_tasks_done:  # type: ignore[attr-defined]
+                if log_queue.unfinished_tasks:  # type: ignore[attr-defined]
+                    log_queue.all_tasks_done.wait(0.1)  # type: ignore[attr-defined]
+        if self.listener is not None:
+            for handler in self.listener.handlers:
+                handler.flush()
+
+
+class _DrainFlushQueueListener(QueueListener):
+    """QueueListener que descarrega os handlers periodicamente.
+
+    Os registros se acumulam no buffer dos arquivos e são gravados quando a
+    fila esvazia, no máximo uma vez a cada ``flush_interval`` segundos. Se
+    nada mais chegar, a própria espera da fila expira e grava o restante.
+    """
+
+    def __init__(
+        self,
+        queue: queue.Queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        flush_interval: float = _FLUSH_INTERVAL,
+    ) -> None:
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._pending = False
+        self._last_flush = 0.0
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while self._pending:
+            remaining = self._last_flush + self.flush_interval - time.monotonic()
+            try:
+                return self.queue.get(timeout=max(remaining, 0.0))  # type: ignore[attr-defined]
+            except queue.Empty:
+                self._flush_handlers()
+        return self.queue.get(block)  # type: ignore[attr-defined]
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending = True
+        if (
+            self.queue.empty()  # type: ignore[attr-defined]
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_handlers()
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+        self._pending = False
+        self._last_flush = time.monotonic()
+
+
+def _setup_async_handlers(
+    logger: logging.Logger, handlers: Iterable[logging.Handler]
+) -> QueueListener:
+    """Encaminha ``handlers`` por uma fila atendida em segundo plano.
+
+    Apenas o ``CallChainQueueHandler`` é anexado ao ``logger``; os handlers
+    reais ficam no ``QueueListener`` retornado, que respeita o nível de cada
+    um e é encerrado automaticamente na saída do processo.
+    """
+    handlers = list(handlers)
+    log_queue: queue.Queue = queue.Queue()
+    queue_handler = CallChainQueueHandler(log_queue)
+    queue_handler.setLevel(min(h.level for h in handlers))
+    listener = _DrainFlushQueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler.listener = listener
+    listener.start()
+    logger.addHandler(queue_handler)
+    setattr(logger, "_queue_listener", listener)
+    atexit.register(_stop_listener, listener)
+    return listener
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Encerra ``listener`` (se ativo) após esvaziar a fila e fecha seus handlers."""
+    if listener._thread is None:  # type: ignore[attr-defined]
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
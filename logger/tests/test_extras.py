@@ -1,3 +1,4 @@
+import json
 import logging
 from types import SimpleNamespace
 
@@ -11,24 +12,48 @@ import logger.extras.dependency as dependency_mod
 import logger.extras.network as network_mod
 import logger.extras.metrics as metrics
 import logger.extras.utils.timer as timer_utils
-import logger.extras.monitoring as monitoring_mod
 
 
 def test_dependency_manager_cache(monkeypatch):
     dm = DependencyManager()
 
-    fake_pkg = type('Dist', (), {'key': 'requests', 'version': '1.0'})
-    monkeypatch.setattr(dependency_mod.pkg_resources, 'working_set', [fake_pkg], raising=False)
+    fake_dist = SimpleNamespace(metadata={'Name': 'Requests'}, version='1.0')
+    calls = []
+    monkeypatch.setattr(
+        dependency_mod.importlib_metadata,
+        'distributions',
+        lambda: calls.append(1) or [fake_dist],
+    )
+    dependency_mod._installed_packages.cache_clear()
 
-    t = [0.0]
-    monkeypatch.setattr(dependency_mod.time, 'time', lambda: t[0])
     info1 = dm.get_environment_info()
-    t[0] += 10
+    assert info1['packages'] == {'requests': '1.0'}
     info2 = dm.get_environment_info()
     assert info1 is info2
-    t[0] += dm._cache_duration + 1
-    info3 = dm.get_environment_info()
+    # outro manager reaproveita a varredura dos pacotes
+    assert DependencyManager().get_environment_info()['packages'] == info1['packages']
+    assert calls == [1]
+    info3 = dm.get_environment_info(force_update=True)
     assert info3 is not info1
+    assert calls == [1, 1]
+    assert info3['python'] == info1['python']
+    assert info3['system'] == info1['system']
+    assert type(info3['packages']) is dict
+    json.dumps(info3)
+    dependency_mod._installed_packages.cache_clear()
+
+
+def test_installed_packages_first_path_entry_wins(monkeypatch):
+    dists = [
+        SimpleNamespace(metadata={'Name': 'typing_extensions'}, version='2.0'),
+        SimpleNamespace(metadata={'Name': 'Typing-Extensions'}, version='1.0'),
+    ]
+    monkeypatch.setattr(dependency_mod.importlib_metadata, 'distributions', lambda: dists)
+    dependency_mod._installed_packages.cache_clear()
+    try:
+        assert dict(dependency_mod._installed_packages()) == {'typing-extensions': '2.0'}
+    finally:
+        dependency_mod._installed_packages.cache_clear()
 
 
 def test_logger_log_environment(tmp_path, caplog, monkeypatch):
@@ -66,34 +91,62 @@ def test_network_monitor_measure_latency(monkeypatch):
     class FakeResp:
         status_code = 200
         content = b'OK'
+        headers = {}
 
     t = [0.0]
     def fake_time():
         return t[0]
-    monkeypatch.setattr(network_mod.time, 'time', fake_time)
+    monkeypatch.setattr(network_mod.time, 'monotonic', fake_time)
 
     t[0] = 0
     def fake_get(url, timeout=1.0):
         t[0] = 0.05
         return FakeResp()
-    monkeypatch.setattr(network_mod.requests, 'get', fake_get)
-    result = nm.measure_latency('http://example.com')
+    monkeypatch.setattr(nm._session, 'get', fake_get)
+    result = nm.measure_latency('http://example.com', head_only=False)
     assert result['status_code'] == 200
     assert result['content_size'] == 2
     assert abs(result['latency'] - 50) < 1e-6
     metrics = nm.metrics['example.com']
     assert metrics['total_requests'] == 1
     assert metrics['total_bytes'] == 2
-    assert metrics['latencies'] == [50]
+    assert list(metrics['latencies']) == [50]
+    assert metrics['ewma_latency'] == 50
+
+
+def test_network_monitor_latency_window(monkeypatch):
+    nm = NetworkMonitor()
+
+    class FakeResp:
+        status_code = 200
+        content = b''
+        headers = {}
+
+    t = [0.0]
+    monkeypatch.setattr(network_mod.time, 'monotonic', lambda: t[0])
+
+    def fake_head(url, timeout=1.0, allow_redirects=True):
+        t[0] += 0.001 * (metrics['total_requests'] + 1)
+        return FakeResp()
+
+    monkeypatch.setattr(nm._session, 'head', fake_head)
+    metrics = nm.metrics['example.com']
+    for _ in range(network_mod._MAX_LATENCY_SAMPLES + 5):
+        nm.measure_latency('http://example.com')
+    assert metrics['total_requests'] == network_mod._MAX_LATENCY_SAMPLES + 5
+    assert len(metrics['latencies']) == network_mod._MAX_LATENCY_SAMPLES
+    assert metrics['count_latency'] == network_mod._MAX_LATENCY_SAMPLES
+    assert abs(metrics['sum_latency'] - sum(metrics['latencies'])) < 1e-6
+    assert min(metrics['latencies']) < metrics['ewma_latency'] <= max(metrics['latencies'])
 
 
 def test_network_monitor_connection_error(monkeypatch):
     nm = NetworkMonitor()
 
-    def fake_get(url, timeout=1.0):
+    def fake_head(url, timeout=1.0, allow_redirects=True):
         raise requests.exceptions.ConnectionError("fail")
 
-    monkeypatch.setattr(network_mod.requests, 'get', fake_get)
+    monkeypatch.setattr(nm._session, 'head', fake_head)
 
     result = nm.measure_latency('http://example.com')
     assert result['type'] == 'ConnectionError'
@@ -104,12 +157,12 @@ def test_network_monitor_connection_error(monkeypatch):
 def test_network_monitor_name_resolution_error(monkeypatch, caplog):
     nm = NetworkMonitor()
 
-    def fake_get(url, timeout=1.0):
+    def fake_head(url, timeout=1.0, allow_redirects=True):
         raise requests.exceptions.ConnectionError(
             "HTTPSConnectionPool(host='x', port=443): Max retries exceeded with url: / (Caused by NameResolutionError('fail'))"
         )
 
-    monkeypatch.setattr(network_mod.requests, 'get', fake_get)
+    monkeypatch.setattr(nm._session, 'head', fake_head)
     with caplog.at_level(logging.WARNING):
         result = nm.measure_latency('http://example.com')
     assert result['error'] == 'sem conectividade'
@@ -118,21 +171,65 @@ def test_network_monitor_name_resolution_error(monkeypatch, caplog):
 def test_network_monitor_generic_exception(monkeypatch):
     nm = NetworkMonitor()
 
-    def fake_get(url, timeout=1.0):
+    def fake_head(url, timeout=1.0, allow_redirects=True):
         raise RuntimeError('boom')
 
-    monkeypatch.setattr(network_mod.requests, 'get', fake_get)
+    monkeypatch.setattr(nm._session, 'head', fake_head)
     result = nm.measure_latency('http://example.com')
     assert result['type'] == 'Exception'
 
 
+def test_network_monitor_head_fallback(monkeypatch):
+    nm = NetworkMonitor()
+    calls = []
+
+    class FakeResp:
+        def __init__(self, status_code, headers):
+            self.status_code = status_code
+            self.headers = headers
+
+        def close(self):
+            calls.append('close')
+
+    def fake_head(url, timeout=1.0, allow_redirects=True):
+        calls.append('head')
+        return FakeResp(405, {})
+
+    def fake_get(url, timeout=1.0, stream=False):
+        calls.append(('get', stream))
+        return FakeResp(200, {'Content-Length': '2048'})
+
+    monkeypatch.setattr(nm._session, 'head', fake_head)
+    monkeypatch.setattr(nm._session, 'get', fake_get)
+    result = nm.measure_latency('http://example.com')
+    assert calls == ['head', ('get', True), 'close']
+    assert result['status_code'] == 200
+    assert result['content_size'] == 2048
+
+
+def test_measure_latency_head_without_length(monkeypatch):
+    nm = NetworkMonitor()
+
+    class FakeResp:
+        status_code = 200
+        headers = {'Transfer-Encoding': 'chunked'}
+
+    monkeypatch.setattr(nm._session, 'head', lambda url, timeout=1.0, allow_redirects=True: FakeResp())
+    result = nm.measure_latency('http://example.com')
+    assert result['content_size'] is None
+    assert nm.metrics['example.com']['total_bytes'] == 0
+
+
 def test_logger_check_connectivity_and_metrics(tmp_path, caplog, monkeypatch):
     logger = start_logger('net', log_dir=str(tmp_path), console_level='INFO')
 
     dummy_nm = SimpleNamespace()
     dummy_nm.check_connection = lambda host='8.8.8.8', port=53, timeout=1.0: (True, 20.0)
     dummy_nm.measure_latency = lambda url, timeout=1.0: {'latency': 30.0, 'status_code': 200, 'content_size': 2}
-    dummy_nm.metrics = {'example.com': {'total_requests': 1, 'total_errors': 0, 'total_bytes': 2, 'latencies': [30.0]}}
+    dummy_nm.metrics = {'example.com': {
+        'total_requests': 1, 'total_errors': 0, 'total_bytes': 2,
+        'latencies': [30.0], 'sum_latency': 30.0, 'count_latency': 1,
+    }}
     monkeypatch.setattr(logger, '_net_monitor', dummy_nm, raising=False)
 
     with caplog.at_level(logging.INFO):
@@ -144,6 +241,17 @@ def test_logger_check_connectivity_and_metrics(tmp_path, caplog, monkeypatch):
     logger.end()
 
 
+def test_logger_check_connectivity_unknown_size(tmp_path, monkeypatch):
+    logger = start_logger('netsize', log_dir=str(tmp_path), console_level='CRITICAL')
+    dummy_nm = SimpleNamespace()
+    dummy_nm.check_connection = lambda host='8.8.8.8', port=53, timeout=1.0: (True, 20.0)
+    dummy_nm.measure_latency = lambda url, timeout=1.0: {'latency': 30.0, 'status_code': 200, 'content_size': None}
+    monkeypatch.setattr(logger, '_net_monitor', dummy_nm, raising=False)
+    block = logger.check_connectivity(['http://example.com'], return_block=True)
+    assert 'Tamanho: desconhecido' in block
+    logger.end()
+
+
 def test_logger_check_connectivity_offline(tmp_path, caplog, monkeypatch):
     logger = start_logger('off', log_dir=str(tmp_path), console_level='INFO')
 
@@ -165,7 +273,7 @@ def test_metrics_tracker_and_timer(tmp_path, caplog, monkeypatch):
     logger = start_logger('metrics', log_dir=str(tmp_path), console_level='INFO')
 
     t = [0.0]
-    monkeypatch.setattr(metrics.time, 'time', lambda: t[0])
+    monkeypatch.setattr(metrics.time, 'monotonic', lambda: t[0])
     monkeypatch.setattr(timer_utils.time, 'time', lambda: t[0])
 
     logger.reset_metrics()
@@ -188,7 +296,7 @@ def test_start_logger_calls_check_connectivity(tmp_path, monkeypatch):
         called['n'] += 1
         return 'X'
 
-    monkeypatch.setattr(network_mod, 'logger_check_connectivity', fake_check)
+    monkeypatch.setattr(logging.Logger, 'check_connectivity', fake_check)
 
     logger = start_logger('auto', log_dir=str(tmp_path), console_level='INFO')
     assert called['n'] == 1
@@ -202,7 +310,7 @@ def test_connectivity_block_in_banners(tmp_path, caplog, monkeypatch):
         calls.append(return_block)
         return 'CONNECT'
 
-    monkeypatch.setattr(network_mod, 'logger_check_connectivity', fake_check)
+    monkeypatch.setattr(logging.Logger, 'check_connectivity', fake_check)
 
     with caplog.at_level(logging.INFO):
         logger = start_logger('banner', log_dir=str(tmp_path), console_level='INFO')
@@ -219,7 +327,7 @@ def test_start_logger_calls_memory_snapshot(tmp_path, monkeypatch):
     def fake_snapshot(self):
         called['n'] += 1
 
-    monkeypatch.setattr(monitoring_mod, 'logger_memory_snapshot', fake_snapshot)
+    monkeypatch.setattr(logging.Logger, 'memory_snapshot', fake_snapshot)
 
     logger = start_logger('mem', log_dir=str(tmp_path), console_level='INFO')
     assert called['n'] == 1
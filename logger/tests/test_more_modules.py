@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+import pytest
 
 
 from logger import start_logger
@@ -17,14 +18,16 @@ def _no_profiler_start(self):
 
 def test_check_connection_success_and_failure(monkeypatch):
     nm = network_mod.NetworkMonitor()
+    nm._conn_ttl = 0
 
     t = [0.0]
-    monkeypatch.setattr(network_mod.time, "time", lambda: t[0])
+    monkeypatch.setattr(network_mod.time, "monotonic", lambda: t[0])
 
     def ok_conn(addr, timeout=1.0):
         t[0] = 0.05
         class Dummy:
-            pass
+            def close(self):
+                pass
         return Dummy()
 
     monkeypatch.setattr(network_mod.socket, "create_connection", ok_conn)
@@ -41,12 +44,47 @@ def test_check_connection_success_and_failure(monkeypatch):
     assert lat is None
 
 
+def test_network_monitor_lazy_executor():
+    nm = network_mod.NetworkMonitor()
+    assert nm._executor is None
+    executor = nm.executor
+    assert nm.executor is executor
+    executor.shutdown()
+
+
+def test_check_connection_cached(monkeypatch):
+    nm = network_mod.NetworkMonitor()
+    calls = []
+    now = [100.0]
+    monkeypatch.setattr(network_mod.time, "monotonic", lambda: now[0])
+
+    class Dummy:
+        def close(self):
+            pass
+
+    def conn(addr, timeout=1.0):
+        calls.append(addr)
+        return Dummy()
+
+    monkeypatch.setattr(network_mod.socket, "create_connection", conn)
+    first = nm.check_connection()
+    assert nm.check_connection() == first
+    assert len(calls) == 1
+    nm.check_connection(host="1.1.1.1")
+    assert len(calls) == 2
+    now[0] += nm._conn_ttl
+    nm.check_connection()
+    assert len(calls) == 3
+
+
 def test_logger_get_network_metrics_average(tmp_path, monkeypatch):
     monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
     logger = start_logger("avg", log_dir=str(tmp_path), console_level="CRITICAL")
     nm = network_mod.NetworkMonitor()
     metrics = nm.metrics["site.com"]
-    metrics["latencies"] = [10.0, 20.0, 30.0]
+    metrics["latencies"].extend([10.0, 20.0, 30.0])
+    metrics["sum_latency"] = 60.0
+    metrics["count_latency"] = 3
     metrics["total_requests"] = 3
     setattr(logger, "_net_monitor", nm)
     data = logger.get_network_metrics("site.com")
@@ -88,10 +126,231 @@ def test_system_monitor_diff_without_snapshot(monkeypatch):
     assert obj == {}
 
 
+def test_system_monitor_status_ttl(monkeypatch):
+    sm = monitoring_mod.SystemMonitor()
+    t = [0.0]
+    calls = []
+    monkeypatch.setattr(monitoring_mod.time, "monotonic", lambda: t[0])
+    monkeypatch.setattr(sm, "get_cpu_usage", lambda: calls.append(1) or (1.0, 2.0))
+    monkeypatch.setattr(sm, "get_memory_usage", lambda: (3.0, 4.0))
+
+    assert sm.get_status() == (1.0, 2.0, 3.0, 4.0)
+    t[0] += sm.status_ttl / 2
+    sm.get_status()
+    assert len(calls) == 1
+    t[0] += sm.status_ttl
+    sm.get_status()
+    assert len(calls) == 2
+
+
+# ----------------------- Context tests ------------------------------
+
+def test_nested_context_in_records(tmp_path, caplog, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("ctx", log_dir=str(tmp_path), console_level="CRITICAL")
+    with caplog.at_level(logging.INFO):
+        with logger.context("A"):
+            with logger.context("B"):
+                logger.info("dentro")
+                assert logger._context_manager.get_context_names() == ["A", "B"]
+            logger.info("fora")
+    contexts = [getattr(r, "context", "") for r in caplog.records if r.msg in ("dentro", "fora")]
+    assert contexts[0].startswith("A → B")
+    assert contexts[1].startswith("A") and "B" not in contexts[1]
+    assert logger._context_manager.get_current_context() == ""
+    assert logger._context_manager.get_context_names() == []
+    logger.end()
+
+
+def test_context_works_as_decorator(tmp_path, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("ctx_dec", log_dir=str(tmp_path), console_level="CRITICAL")
+
+    @logger.context("D")
+    def current():
+        return logger._context_manager.get_current_context()
+
+    with logger.context("A"):
+        assert current() == "A → D"
+    assert current() == "D"
+    assert logger._context_manager.get_current_context() == ""
+    logger.end()
+
+
+def test_log_with_context_skips_disabled_levels(tmp_path, monkeypatch):
+    import logger.core.context as context_mod
+
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("ctx_lvl", log_dir=str(tmp_path), console_level="CRITICAL")
+    calls = []
+    monkeypatch.setattr(context_mod, "_get_file_context", lambda: calls.append(1))
+    logger.setLevel(logging.INFO)
+    logger._log(logging.DEBUG, "ignorado", ())
+    assert calls == []
+    logger._log(logging.INFO, "registrado", ())
+    assert calls == [1]
+    logger.end()
+
+
+def test_context_wrapper_limited_to_configured_loggers(tmp_path, monkeypatch):
+    import logger.core.context as context_mod
+
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    plain = logging.Logger("plain")
+    logger = start_logger("ctx_cls", log_dir=str(tmp_path), console_level="CRITICAL")
+    assert isinstance(logger, context_mod.ContextLogger)
+    assert logging.getLoggerClass() is logging.Logger
+    assert logging.Logger._log is context_mod._original_log_method
+    assert plain._log.__func__ is context_mod._original_log_method
+    logger.end()
+
+    preexisting = logging.Logger("pre")
+    context_mod._setup_context_and_profiling(preexisting)
+    assert preexisting._log.__func__ is context_mod.log_with_context
+
+
+def test_file_context_names_user_module():
+    from logger.core.context import _get_file_context
+
+    namespace = {"__name__": "app", "file_ctx": _get_file_context}
+    exec(compile("def run():\n    return file_ctx()\n", "/proj/app.py", "exec"), namespace)
+    assert namespace["run"]() == "app"
+    exec(compile("def run():\n    return file_ctx()\n", "/proj/main.py", "exec"), namespace)
+    assert namespace["run"]() is None
+
+
+def test_file_context_cache_is_bounded(monkeypatch):
+    import logger.core.context as context_mod
+
+    monkeypatch.setattr(context_mod, "_FILE_CONTEXTS_MAX", 4)
+    for i in range(10):
+        namespace = {"__name__": "app", "file_ctx": context_mod._get_file_context}
+        exec(compile("def run():\n    return file_ctx()\n", f"/proj/gen{i}.py", "exec"), namespace)
+        assert namespace["run"]() == f"gen{i}"
+    generated = [e for e in context_mod._FILE_CONTEXTS.values() if "/proj/gen" in e[0].co_filename]
+    assert len(generated) < 10
+
+
+def test_profiler_format_top_reuses_report():
+    from logger.core.context import Profiler
+
+    prof = Profiler()
+    assert prof.format_top() == "Profiler não está ativo"
+    assert prof.stop() == "Profiler não está ativo"
+    prof.start()
+    sum(range(10))
+    report = prof.stop()
+    assert "cumulative" in report
+    assert prof.format_top() is report
+    first = prof.profiler
+    prof.start()
+    assert prof._last_report is None
+    assert prof.profiler is first
+    prof.stop()
+
+
+def test_sampling_profiler_reports_hot_function():
+    import time as _time
+    from logger.core.context import Profiler
+
+    namespace: dict = {"__name__": "app", "_time": _time}
+    exec(compile(
+        "def hot():\n"
+        "    end = _time.monotonic() + 0.1\n"
+        "    while _time.monotonic() < end:\n"
+        "        pass\n",
+        "app.py", "exec"), namespace)
+    prof = Profiler(sampling=True, interval=0.001)
+    prof.start()
+    namespace["hot"]()
+    prof.stop()
+    assert prof.format_top()
+    stats = prof.profiler.stats()
+    busiest = max(stats.items(), key=lambda kv: kv[1][2])[0]
+    assert busiest[2] == "hot"
+
+
+@pytest.mark.parametrize("sampling", [False, True])
+def test_profiler_reset_while_active(sampling):
+    from logger.core.context import Profiler
+
+    prof = Profiler(sampling=sampling, interval=0.001)
+    prof.start()
+    sum(range(10000))
+    old = prof.profiler
+    prof.reset()
+    if sampling:
+        assert old._thread is None
+        assert prof.profiler is not old
+    prof.stop()
+    assert "não está ativo" not in prof.format_top()
+
+
+def test_sampling_profiler_report_while_running():
+    import time as _time
+    from logger.core.context import Profiler
+
+    prof = Profiler(sampling=True, interval=0.001)
+    prof.start()
+    end = _time.monotonic() + 0.1
+    while _time.monotonic() < end:
+        prof.get_report_lines()
+    stats = prof.profiler.stats()
+    prof.stop()
+    assert prof.profiler.elapsed() > 0
+    assert any(entry[3] > 0 for entry in stats.values())
+
+
+def test_sampling_profiler_accumulates_without_reset():
+    from logger.core.context import Profiler
+
+    prof = Profiler(sampling=True, interval=0.001)
+    prof.start()
+    prof.stop()
+    first = prof.profiler
+    elapsed = first._elapsed
+    prof.start(reset=False)
+    prof.stop()
+    assert prof.profiler is first
+    assert first._elapsed >= elapsed
+
+
+def test_profiler_report_skips_internal_entries():
+    from types import SimpleNamespace
+    from logger.core.context import Profiler
+
+    user = ("/proj/app.py", 1, "trabalho")
+    internal = ("/proj/logger/core/context.py", 1, "log_with_context")
+    stats = {
+        internal: (1, 1, 0.0, 9.0, {}),
+        user: (2, 2, 0.5, 1.0, {}),
+    }
+    prof = Profiler(sampling=True)
+    prof.profiler = SimpleNamespace(stats=lambda: stats)
+    lines = prof.get_report_lines(limit=1)
+    assert len(lines) == 1 and lines[0].startswith("trabalho |")
+
+
+def test_profiler_build_chain_follows_heaviest_caller():
+    from logger.core.context import Profiler
+
+    a, b, c, x = ("a.py", 1, "a"), ("b.py", 1, "b"), ("c.py", 1, "c"), ("x.py", 1, "x")
+    stats = {
+        c: (1, 1, 0.0, 0.0, {b: (1, 1, 0.0, 1.0), x: (1, 1, 0.0, 0.5)}),
+        b: (1, 1, 0.0, 0.0, {a: (1, 1, 0.0, 2.0)}),
+        a: (1, 1, 0.0, 0.0, {}),
+    }
+    prof = Profiler()
+    memo: dict = {}
+    assert prof._build_chain(c, stats, best_callers=memo) == [a, b, c]
+    assert memo == {c: b, b: a, a: None}
+    assert prof._build_chain(c, stats, depth=1) == [b, c]
+
+
 # ----------------------- Logger core tests --------------------------
 
 def _info_fmt(logger: logging.Logger) -> str:
-    for h in logger.handlers:
+    for h in logger._queue_listener.handlers:
         if isinstance(h, logging.FileHandler) and h.level == logging.INFO:
             return str(h.formatter._fmt)  # type: ignore[attr-defined, union-attr]
     raise AssertionError("info handler not found")
@@ -114,7 +373,376 @@ def test_configure_base_logger_formats(tmp_path):
     logger3 = _configure_base_logger("f3", str(base / "3"), verbose=3)
     fmt3 = _info_fmt(logger3)
     assert "{thread_disp}" in fmt3
+    formatters = {id(h.formatter) for h in logger3._queue_listener.handlers}
+    assert len(formatters) == 1
 
     assert hasattr(logging.Logger, "progress")
-    assert len(logger0.handlers) == 3
+    assert len(logger0.handlers) == 2
+    assert len(logger0._queue_listener.handlers) == 2
     assert Path(logger0.log_path).is_file()
+
+
+def test_compiled_formats_match_template():
+    from logger.core.logger_core import _COMPILED_FMTS
+
+    record = logging.makeLogRecord({"msg": "oi"})
+    for field in ("asctime", "emoji", "levelname_color", "levelpad", "message", "thread_disp"):
+        setattr(record, field, f"<{field}>")
+    for fmt, render in _COMPILED_FMTS.items():
+        assert render(record) == fmt.format(**record.__dict__)
+
+
+def test_level_names_accept_aliases():
+    from logger.core.logger_core import _level_value
+
+    assert _level_value("WARN") == logging.WARNING
+    assert _level_value("FATAL") == logging.CRITICAL
+    assert _level_value("success") == 25
+    with pytest.raises(ValueError, match="DEBUG"):
+        _level_value("VERBOSO")
+
+
+def test_buffered_file_handler_flushes_on_warning(tmp_path):
+    from logger.handlers import BufferedFileHandler
+
+    path = tmp_path / "buf.log"
+    handler = BufferedFileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.emit(logging.makeLogRecord({"msg": "info", "levelno": logging.INFO}))
+    assert path.read_text(encoding="utf-8") == ""
+    handler.emit(logging.makeLogRecord({"msg": "aviso", "levelno": logging.WARNING}))
+    assert path.read_text(encoding="utf-8") == "info\naviso\n"
+    handler.close()
+
+
+def test_dedup_filter_drops_repeats_within_window(monkeypatch):
+    from logger.handlers import DedupFilter
+    import logger.handlers as handlers_mod
+
+    now = [100.0]
+    monkeypatch.setattr(handlers_mod.time, "monotonic", lambda: now[0])
+    dedup = DedupFilter(window=0.05)
+
+    def rec(msg, level=logging.INFO, thread=1):
+        return logging.makeLogRecord(
+            {"name": "app", "msg": msg, "levelno": level, "thread": thread}
+        )
+
+    assert dedup.filter(rec("loop"))
+    assert not dedup.filter(rec("loop"))
+    # outra thread com a mesma mensagem nao e suprimida
+    assert dedup.filter(rec("loop", thread=2))
+    assert dedup.filter(rec("outra"))
+    assert dedup.filter(rec("loop", logging.ERROR))
+    assert dedup.filter(rec("loop", logging.ERROR))
+    now[0] += 0.1
+    assert dedup.filter(rec("loop"))
+
+
+def test_listener_flushes_periodically(tmp_path):
+    import queue
+    import time
+    from logger.handlers import BufferedFileHandler
+    from logger.handlers.queue_handler import _DrainFlushQueueListener
+
+    path = tmp_path / "periodic.log"
+    handler = BufferedFileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.Queue = queue.Queue()
+    listener = _DrainFlushQueueListener(log_queue, handler, flush_interval=0.2)
+    listener._last_flush = time.monotonic()
+    listener.start()
+    log_queue.put(logging.makeLogRecord({"msg": "a", "levelno": logging.INFO}))
+    log_queue.join()
+    assert path.read_text(encoding="utf-8") == ""
+    deadline = time.monotonic() + 2
+    while path.read_text(encoding="utf-8") == "" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert path.read_text(encoding="utf-8") == "a\n"
+    listener.stop()
+    handler.close()
+
+
+def test_records_after_listener_stop_are_written(tmp_path, monkeypatch):
+    import threading
+    from logger.handlers import _stop_listener
+
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("late", log_dir=str(tmp_path), console_level="CRITICAL")
+    _stop_listener(logger._queue_listener)
+    logger.info("registro tardio")
+    flusher = threading.Thread(target=lambda: [h.flush() for h in logger.handlers])
+    flusher.start()
+    flusher.join(2)
+    assert not flusher.is_alive()
+    assert "registro tardio" in Path(logger.log_path).read_text(encoding="utf-8")
+    for handler in logger._queue_listener.handlers:
+        handler.close()
+
+
+def test_end_flushes_buffered_files(tmp_path, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("buffered", log_dir=str(tmp_path), console_level="CRITICAL")
+    logger.info("registro em buffer")
+    logger.end()
+    assert "registro em buffer" in Path(logger.log_path).read_text(encoding="utf-8")
+
+
+def test_start_logger_reuses_active_logger(tmp_path, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("reuse", log_dir=str(tmp_path), console_level="CRITICAL")
+    listener = logger._queue_listener
+    assert start_logger("reuse", log_dir=str(tmp_path), console_level="CRITICAL") is logger
+    assert logger._queue_listener is listener
+    start_logger("reuse", log_dir=str(tmp_path), console_level="CRITICAL", verbose=2)
+    assert logger._queue_listener is not listener
+    listener = logger._queue_listener
+    logger.end()
+    start_logger("reuse", log_dir=str(tmp_path), console_level="CRITICAL")
+    assert logger._queue_listener is not listener
+    logger.end()
+
+
+def test_file_buffer_size_reaches_file_handlers(tmp_path, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger(
+        "linebuf", log_dir=str(tmp_path), console_level="CRITICAL", file_buffer_size=1
+    )
+    assert {h.buffer_size for h in logger._queue_listener.handlers} == {1}
+    logger.end()
+
+
+def test_file_buffer_size_rejects_unbuffered(tmp_path):
+    from logger.handlers import BufferedFileHandler
+
+    with pytest.raises(ValueError, match="file_buffer_size"):
+        start_logger("nobuf", log_dir=str(tmp_path), file_buffer_size=0)
+    with pytest.raises(ValueError, match="buffer_size"):
+        BufferedFileHandler(tmp_path / "zero.log", buffer_size=0)
+
+
+# ----------------------- Formatter tests ----------------------------
+
+def test_call_chain_lists_user_functions():
+    from logger.formatters.custom import _extract_call_chain
+
+    # funcoes definidas fora do pacote ``logger`` entram na cadeia
+    namespace = {"__name__": "app", "extract": _extract_call_chain}
+    source = (
+        "def inner(record):\n    return extract(record)\n"
+        "def outer(record):\n    return inner(record)\n"
+    )
+    exec(compile(source, "app.py", "exec"), namespace)
+    record = logging.makeLogRecord({"funcName": "fallback"})
+    chain = namespace["outer"](record)
+    assert chain.endswith("outer>inner")
+
+
+def test_frame_name_cache_is_bounded(monkeypatch):
+    import logger.formatters.custom as custom_mod
+
+    monkeypatch.setattr(custom_mod, "_FRAME_NAMES_MAX", 4)
+    record = logging.makeLogRecord({"funcName": "f"})
+    for i in range(10):
+        namespace = {"__name__": "app", "extract": custom_mod._extract_call_chain}
+        exec(compile("def f(r):\n    return extract(r)\n", f"gen{i}.py", "exec"), namespace)
+        namespace["f"](record)
+    generated = [c for c, _ in custom_mod._FRAME_NAMES.values() if c.co_filename.startswith("gen")]
+    assert len(generated) < 10
+
+
+def test_formatter_skips_call_chain_when_unused(monkeypatch):
+    import logger.formatters.custom as custom_mod
+
+    calls = []
+    monkeypatch.setattr(
+        custom_mod, "_extract_call_chain", lambda record: calls.append(record) or "x"
+    )
+    console = custom_mod.CustomFormatter(fmt="{levelname} {message}", style="{")
+    full = custom_mod.CustomFormatter(fmt="{message} {call_chain}", style="{")
+    record = logging.makeLogRecord(
+        {"msg": "oi", "levelname": "INFO", "pathname": "/pkg/logger/x.py", "funcName": "f"}
+    )
+
+    console.format(record)
+    assert calls == []
+    assert record.call_chain == "f"
+
+    full.format(record)
+    assert len(calls) == 1
+
+    monkeypatch.setattr(custom_mod, "_CALL_CHAIN_ENABLED", False)
+    full.format(record)
+    assert len(calls) == 1
+
+
+def test_formatter_thread_display():
+    import threading
+    from logger.formatters.custom import CustomFormatter
+
+    fmt = CustomFormatter(fmt="{message}{thread_disp}", style="{", use_color=False)
+    main = logging.makeLogRecord({"msg": "a", "levelname": "INFO"})
+    assert fmt.format(main).startswith("a")
+    assert main.thread_disp == ""
+
+    records = []
+    worker = threading.Thread(
+        target=lambda: records.append(logging.makeLogRecord({"msg": "b", "levelname": "INFO"})),
+        name="Worker",
+    )
+    worker.start()
+    worker.join()
+    fmt.format(records[0])
+    assert records[0].thread_disp == "[T:Worker]"
+
+
+def test_formatter_interpolates_message_once():
+    from logger.formatters.custom import CustomFormatter
+
+    class Arg:
+        calls = 0
+
+        def __str__(self):
+            Arg.calls += 1
+            return "v"
+
+    record = logging.makeLogRecord(
+        {"msg": "valor %s", "args": (Arg(),), "levelname": "INFO", "context": "ctx"}
+    )
+    plain = CustomFormatter(fmt="{message}", style="{", use_color=False)
+    other = CustomFormatter(fmt="{levelname} {message}", style="{", use_color=False)
+    assert plain.format(record).startswith("[ctx] valor v")
+    assert "[ctx] valor v" in other.format(record)
+    assert Arg.calls == 1
+    assert record.msg == "valor %s"
+
+
+def test_formatter_reuses_output_for_same_format(monkeypatch):
+    import logger.formatters.custom as custom_mod
+
+    calls = []
+    original = logging.Formatter.format
+    monkeypatch.setattr(
+        logging.Formatter, "format", lambda self, r: calls.append(1) or original(self, r)
+    )
+    fmt = "{asctime} {message}"
+    first = custom_mod.CustomFormatter(fmt=fmt, datefmt="%H:%M:%S", style="{", use_color=False)
+    second = custom_mod.CustomFormatter(fmt=fmt, datefmt="%H:%M:%S", style="{", use_color=False)
+    record = logging.makeLogRecord({"msg": "oi", "levelname": "INFO"})
+    assert first.format(record) == second.format(record)
+    assert len(calls) == 1
+    assert custom_mod._LAST_ASCTIME[0] == int(record.created)
+
+
+def test_log_lazy_skips_disabled_levels(tmp_path, monkeypatch):
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("lazy", log_dir=str(tmp_path), console_level="CRITICAL", file_level="INFO")
+    calls = []
+    logger.log_lazy("DEBUG", "estado %s", lambda: calls.append(1) or "x")
+    assert calls == []
+    logger.log_lazy("info", "estado %s", lambda: calls.append(1) or "pronto")
+    assert calls == [1]
+    with pytest.raises(ValueError):
+        logger.log_lazy("verboso", "x")
+    logger.end()
+    assert "estado pronto" in Path(logger.log_path).read_text(encoding="utf-8")
+
+
+def test_error_attaches_active_exception(tmp_path):
+    logger = _configure_base_logger("tb", str(tmp_path), console_level="CRITICAL")
+    try:
+        raise ValueError("falhou")
+    except ValueError:
+        logger.error("erro")
+    logger.error("sem excecao")
+    for handler in logger.handlers:
+        handler.flush()
+    content = Path(logger.debug_log_path).read_text(encoding="utf-8")
+    assert content.count("Traceback") == 1
+    assert "ValueError: falhou" in content
+
+
+
+# ----------------------- Helpers tests ------------------------------
+
+def test_attach_screenshot_saves_in_background(tmp_path):
+    from logger.extras import helpers
+
+    class FakeDriver:
+        def get_screenshot_as_png(self):
+            return b"PNG"
+
+    future = helpers._attach_screenshot(logging.getLogger("shot"), "img", tmp_path, FakeDriver())
+    future.result()
+    assert (tmp_path / "img.png").read_bytes() == b"PNG"
+    assert helpers._pending_screenshots == 0
+
+    helpers._attach_screenshot(logging.getLogger("shot"), "sync", tmp_path, FakeDriver(), wait=True)
+    assert (tmp_path / "sync.png").read_bytes() == b"PNG"
+
+
+def test_attach_screenshot_after_pool_shutdown(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from logger.extras import helpers
+
+    class FakeDriver:
+        def get_screenshot_as_png(self):
+            return b"PNG"
+
+    closed = ThreadPoolExecutor(max_workers=1)
+    closed.shutdown()
+    monkeypatch.setattr(helpers, "_SCREENSHOT_POOL", closed)
+    future = helpers._attach_screenshot(logging.getLogger("shot"), "late", tmp_path, FakeDriver())
+    assert future.done()
+    assert (tmp_path / "late.png").read_bytes() == b"PNG"
+    assert helpers._pending_screenshots == 0
+
+
+# ----------------------- Progress tests -----------------------------
+
+class _TtyBuffer:
+    def __init__(self):
+        self.writes = []
+
+    def isatty(self):
+        return True
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def flush(self):
+        pass
+
+
+def test_progress_redraw_single_write(tmp_path, monkeypatch):
+    from logger.extras import progress as progress_mod
+
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("pbar", log_dir=str(tmp_path), console_level="CRITICAL")
+    out = _TtyBuffer()
+    monkeypatch.setattr(progress_mod.sys, "stdout", out)
+    pbar = progress_mod.LoggerProgressBar(logger, total=2, desc="Tarefa")
+    pbar.last_line_len = 100
+    out.writes.clear()
+    pbar._print_progress()
+    assert len(out.writes) == 1
+    assert out.writes[0].startswith("\rTarefa: [")
+    assert len(out.writes[0]) == 101
+    pbar.close()
+    logger.end()
+
+
+def test_progress_update_builds_info_once(tmp_path, monkeypatch):
+    from logger.extras import progress as progress_mod
+
+    monkeypatch.setattr('logger.core.context.Profiler.start', _no_profiler_start)
+    logger = start_logger("pbar_info", log_dir=str(tmp_path), console_level="CRITICAL")
+    monkeypatch.setattr(progress_mod.sys, "stdout", _TtyBuffer())
+    pbar = progress_mod.LoggerProgressBar(logger, total=10, desc="X", log_interval=0)
+    calls = []
+    original = pbar._get_progress_info
+    monkeypatch.setattr(pbar, "_get_progress_info", lambda *a: calls.append(1) or original(*a))
+    pbar.update()
+    assert len(calls) == 1
+    pbar.close()
+    logger.end()